@@ -1,3 +1,5 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
@@ -13,6 +15,7 @@ from knowlang.chat_bot import (
     StreamingChatResult,
 )
 from knowlang.api import ApiModelRegistry
+from knowlang.search.reranking import GraphCodeBertReranker
 
 LOG = FancyLogger(__name__)
 
@@ -38,8 +41,20 @@ def custom_openapi():
     app.openapi_schema = openapi_schema
     return app.openapi_schema
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the vector store and load the reranker before serving the first request"""
+    try:
+        VectorStoreFactory.get(config.db, config.embedding)
+        await asyncio.to_thread(GraphCodeBertReranker(config.reranker).warm_up)
+        LOG.info("Vector store and reranker warmed up")
+    except Exception as e:
+        # Requests will retry the lazy initialization and report the error
+        LOG.warning(f"Warm-up failed, components will load on first request: {e}")
+    yield
+
 # Create FastAPI app
-app = FastAPI(title="KnowLang API")
+app = FastAPI(title="KnowLang API", lifespan=lifespan)
 app.openapi = custom_openapi
 
 # Add CORS middleware
@@ -77,6 +92,7 @@ async def stream_chat(
     async def event_generator():
         # Process using the core logic from Gradio
         async for result in stream_chat_progress(query, vector_store, config):
-            yield ServerSentChatEvent(event=result.status, data=result).model_dump()
+            # Serialize the payload with pydantic-core instead of stringifying a dumped dict
+            yield {"event": result.status.value, "data": result.model_dump_json()}
                 
     return EventSourceResponse(event_generator())
\ No newline at end of file
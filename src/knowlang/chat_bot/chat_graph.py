@@ -108,6 +108,9 @@ class RetrievalNode(BaseNode[ChatGraphState, ChatGraphDeps, ChatResult]):
 @dataclass
 class AnswerQuestionNode(BaseNode[ChatGraphState, ChatGraphDeps, ChatResult]):
     """Node that generates the final answer"""
+    # Class-level agent instance for reuse
+    _agent_instance = None
+
     system_prompt = """
 You are an expert code assistant helping developers understand complex codebases. Follow these rules strictly:
 
@@ -126,14 +129,20 @@ You are an expert code assistant helping developers understand complex codebases
 
 Remember: Your primary goal is answering the user's specific question, not explaining the entire codebase."""
 
+    def _get_agent(self, ctx: GraphRunContext[ChatGraphState, ChatGraphDeps]) -> Agent:
+        """Get or create the agent instance"""
+        if self.__class__._agent_instance is None:
+            self.__class__._agent_instance = Agent(
+                create_pydantic_model(
+                    model_provider=ctx.deps.config.llm.model_provider,
+                    model_name=ctx.deps.config.llm.model_name
+                ),
+                system_prompt=self.system_prompt
+            )
+        return self.__class__._agent_instance
+
     async def run(self, ctx: GraphRunContext[ChatGraphState, ChatGraphDeps]) -> End[ChatResult]:
-        answer_agent = Agent(
-            create_pydantic_model(
-                model_provider=ctx.deps.config.llm.model_provider,
-                model_name=ctx.deps.config.llm.model_name
-            ),
-            system_prompt=self.system_prompt
-        )
+        answer_agent = self._get_agent(ctx)
         
         if not ctx.state.retrieved_context:
             return End(ChatResult(
@@ -13,6 +13,11 @@ from .feedback import ChatAnalytics
 
 LOG = FancyLogger(__name__)
 
+# Shared by CodeContext.to_title and the retrieved code blocks
+_CODE_TITLE_TEMPLATE = "📄 {file_path} (lines {start_line}-{end_line})".format
+
+_CODE_BLOCK_TEMPLATE = "<details><summary>{title}</summary>\n\n```python\n{code}\n```\n\n</details>".format
+
 @dataclass
 class CodeContext:
     file_path: str
@@ -21,7 +26,11 @@ class CodeContext:
 
     def to_title(self) -> str:
         """Format code context as a title string"""
-        return f"📄 {self.file_path} (lines {self.start_line}-{self.end_line})"
+        return _CODE_TITLE_TEMPLATE(
+            file_path=self.file_path,
+            start_line=self.start_line,
+            end_line=self.end_line,
+        )
     
     @classmethod
     def from_metadata(cls, metadata: Dict) -> "CodeContext":
@@ -41,9 +50,12 @@ class CodeQAChatInterface:
     
     def _format_code_block(self, code : str,  metadata: Dict) -> str:
         """Format a single code block with metadata"""
-        context = CodeContext.from_metadata(metadata)
-
-        return f"<details><summary>{context.to_title()}</summary>\n\n```python\n{code}\n```\n\n</details>"
+        title = _CODE_TITLE_TEMPLATE(
+            file_path=metadata['file_path'],
+            start_line=metadata['start_line'],
+            end_line=metadata['end_line'],
+        )
+        return _CODE_BLOCK_TEMPLATE(title=title, code=code)
     
     def _handle_feedback(self, like_data: gr.LikeData, history: List[ChatMessage], request: gr.Request):
          # Get the query and response pair
@@ -69,47 +81,46 @@ class CodeQAChatInterface:
         yield history
 
         
-        current_progress: ChatMessage | None = None
+        # Index of the single progress message, updated in place on every tick
+        progress_index: int | None = None
         code_blocks_added = False
         
         try:
             async for result in stream_chat_progress(message, self.vector_store, self.config):
                 # Handle progress updates
                 if result.status != ChatStatus.COMPLETE:
-                    if current_progress:
-                        history.remove(current_progress)
-                    
-                    current_progress = ChatMessage(
-                        role="assistant",
-                        content=result.progress_message,
-                        metadata={
-                            "title": f"{result.status.value.title()} Progress",
-                            "status": "pending" if result.status != ChatStatus.ERROR else "error"
-                        }
-                    )
-                    history.append(current_progress)
+                    title = f"{result.status.value.title()} Progress"
+                    status = "pending" if result.status != ChatStatus.ERROR else "error"
+
+                    if progress_index is None:
+                        history.append(ChatMessage(
+                            role="assistant",
+                            content=result.progress_message,
+                            metadata={"title": title, "status": status}
+                        ))
+                        progress_index = len(history) - 1
+                    else:
+                        progress = history[progress_index]
+                        progress.content = result.progress_message
+                        progress.metadata["title"] = title
+                        progress.metadata["status"] = status
                     yield history
                     continue
 
                 # When complete, remove progress message and add final content
-                if current_progress:
-                    history.remove(current_progress)
-                    current_progress = None
+                if progress_index is not None:
+                    history.pop(progress_index)
+                    progress_index = None
 
                 # Add code blocks before final answer if not added yet
                 if not code_blocks_added and result.retrieved_context:
-                    total_code_blocks = []
-                    for search in result.retrieved_context:
-                        chunk = search.document
-                        metadata = search.metadata
-                        code_block = self._format_code_block(chunk, metadata)
-                        if code_block:
-                            total_code_blocks.append(code_block)
-
                     code_blocks_added = True
                     history.append(ChatMessage(
                         role="assistant",
-                        content='\n\n'.join(total_code_blocks),
+                        content='\n\n'.join(
+                            self._format_code_block(search.document, search.metadata)
+                            for search in result.retrieved_context
+                        ),
                         metadata={
                             "title": "💻 Code Context",
                             "collapsible": True
@@ -1,12 +1,13 @@
 """Output formatters for CLI results."""
 from typing import List, Protocol
-import json
+from pydantic import TypeAdapter
 from rich.console import Console
 from rich.table import Table
 
 from knowlang.core.types import CodeChunk
 
 console = Console()
+_CODE_CHUNKS_ADAPTER = TypeAdapter(List[CodeChunk])
 
 class OutputFormatter(Protocol):
     """Protocol for output formatters."""
@@ -40,7 +41,7 @@ class JsonFormatter:
     """Format output as JSON."""
     
     def display_chunks(self, chunks: List[CodeChunk]) -> None:
-        print(json.dumps([chunk.model_dump() for chunk in chunks], indent=2))
+        print(_CODE_CHUNKS_ADAPTER.dump_json(chunks, indent=2).decode())
 
 def get_formatter(format_type: str) -> OutputFormatter:
     """Get the appropriate formatter for the specified format.
@@ -1,8 +1,8 @@
 from .base import generate_model_config
 from .logging_config import LoggingConfig
-from .config import (AppConfig, DBConfig, EmbeddingConfig, LanguageConfig,
-                     LLMConfig, ModelProvider, ParserConfig, PathPatterns,
-                     RerankerConfig)
+from .config import (DEFAULT_HNSW_PARAMS, AppConfig, DBConfig,
+                     EmbeddingConfig, HNSWParams, LanguageConfig, LLMConfig,
+                     ModelProvider, ParserConfig, PathPatterns, RerankerConfig)
 
 __all__ = [
     "AppConfig",
@@ -10,6 +10,8 @@ __all__ = [
     "RerankerConfig",
     "generate_model_config",
     "DBConfig",
+    "HNSWParams",
+    "DEFAULT_HNSW_PARAMS",
     "ModelProvider",
     "LanguageConfig",
     "LLMConfig",
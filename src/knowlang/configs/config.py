@@ -3,7 +3,7 @@ import os
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import Field, ValidationInfo, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings
 
 from knowlang.core.types import ModelProvider, VectorStoreProvider
@@ -88,6 +88,19 @@ class ParserConfig(BaseSettings):
         default=False,
         description="Enable code summarization to be stored in the vector store"
     )
+    enable_summary_cache: bool = Field(
+        default=False,
+        description="Reuse summaries and embeddings of unchanged chunks across indexing runs"
+    )
+    summarization_batch_size: int = Field(
+        default=8,
+        description="Number of code chunks summarized in a single LLM request"
+    )
+    summarization_max_batch_tokens: int = Field(
+        default=8000,
+        description="Maximum prompt tokens in a single batched summarization request. "
+                    "Chunks exceeding it on their own are summarized in separate requests"
+    )
 
 
 class EmbeddingConfig(BaseSettings):
@@ -112,12 +125,55 @@ class EmbeddingConfig(BaseSettings):
         default=None,
         description="API key for the model provider"
     )
+    batch_size: int = Field(
+        default=32,
+        description="Number of texts to embed in a single provider call"
+    )
+    tei_url: str = Field(
+        default="http://localhost:8080",
+        description="Base URL of the text-embeddings-inference server"
+    )
+    tei_max_client_batch_size: int = Field(
+        default=32,
+        description="Maximum number of inputs per request, matching the TEI server's --max-client-batch-size"
+    )
+    quantization: Optional[Literal["fp16", "q8_0", "q4_0"]] = Field(
+        default=None,
+        description="Quantized variant of an Ollama embedding model to use, appended verbatim to the model tag"
+    )
 
     @field_validator('api_key', mode='after')
     @classmethod
     def validate_api_key(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
         return _validate_api_key(v, info)
 
+    @field_validator('quantization', mode='after')
+    @classmethod
+    def validate_quantization(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
+        # The suffix is not checked against the Ollama library, so reject the tags that cannot exist
+        if not v or info.data.get('model_provider') != ModelProvider.OLLAMA:
+            return v
+        model_name = info.data.get('model_name', '')
+        _, _, tag = model_name.rpartition(":")
+        if ":" not in model_name or tag == "latest":
+            raise ValueError(
+                f"Quantization needs an explicit base tag, e.g. {model_name.split(':')[0]}:<size>, "
+                f"quantized tags are not published for {model_name}"
+            )
+        if tag.endswith(("-fp16", "-q8_0", "-q4_0")):
+            raise ValueError(f"Model tag {model_name} already names a quantization, unset quantization")
+        if v == "fp16" and "-qat" in tag:
+            raise ValueError(f"QAT models such as {model_name} are only published quantized, use q8_0 or q4_0")
+        return v
+
+    @property
+    def resolved_model_name(self) -> str:
+        """Model name sent to the provider, including the quantization suffix for Ollama"""
+        if self.model_provider != ModelProvider.OLLAMA or not self.quantization:
+            return self.model_name
+        # e.g. embeddinggemma:300m-qat -> embeddinggemma:300m-qat-q8_0
+        return f"{self.model_name}-{self.quantization}"
+
 class LLMConfig(BaseSettings):
     model_name: str = Field(
         default="llama3.2",
@@ -135,12 +191,37 @@ class LLMConfig(BaseSettings):
         default_factory=dict,
         description="Additional model settings"
     )
+    max_concurrent: int = Field(
+        default=8,
+        description="Maximum number of concurrent requests to the model provider"
+    )
+    tokenizer_name: Optional[str] = Field(
+        default=None,
+        description="HuggingFace tokenizer used to measure prompt sizes (e.g. 'Xenova/llama3-tokenizer'). "
+                    "If not set, token counts are estimated from character counts"
+    )
 
     @field_validator('api_key', mode='after')
     @classmethod
     def validate_api_key(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
         return _validate_api_key(v, info)
 
+class HNSWParams(BaseModel):
+    """HNSW index parameters shared by the vector store providers. None leaves the backend's own default"""
+    m: Optional[int] = None
+    construction_ef: Optional[int] = None
+    search_ef: Optional[int] = None
+
+# Leave every HNSW parameter to the vector store backend
+DEFAULT_HNSW_PARAMS = HNSWParams()
+
+# (exclusive upper bound on collection size, default HNSW parameters)
+HNSW_DEFAULTS_BY_SIZE = [
+    (100_000, HNSWParams(m=16, construction_ef=64, search_ef=40)),
+    (1_000_000, HNSWParams(m=24, construction_ef=100, search_ef=100)),
+    (None, HNSWParams(m=32, construction_ef=128, search_ef=200)),
+]
+
 class DBConfig(BaseSettings):
     db_provider: VectorStoreProvider = Field(
         default=VectorStoreProvider.CHROMA,
@@ -174,8 +255,52 @@ class DBConfig(BaseSettings):
         default='content',
         description="Field to store the actual content in the vector store"
     )
+    expected_collection_size: int = Field(
+        default=0,
+        description="Expected number of vectors, used to pick default HNSW parameters. "
+                    "0 keeps the backend's defaults for unset parameters"
+    )
+    hnsw_m: Optional[int] = Field(
+        default=None,
+        description="Number of HNSW graph neighbors per node (derived from expected_collection_size if unset)"
+    )
+    hnsw_construction_ef: Optional[int] = Field(
+        default=None,
+        description="HNSW candidate list size while building the index (derived from expected_collection_size if unset)"
+    )
+    hnsw_search_ef: Optional[int] = Field(
+        default=None,
+        description="HNSW candidate list size while searching (derived from expected_collection_size if unset)"
+    )
+    add_batch_size: int = Field(
+        default=256,
+        description="Maximum number of documents written to the vector store in a single call. "
+                    "Batches never span files, so most files are written in one call"
+    )
+    half_precision_index: bool = Field(
+        default=False,
+        description="Build the HNSW index over float16 (halfvec) casts of the embeddings. "
+                    "PostgreSQL only, requires pgvector >= 0.7"
+    )
     state_store: StateStoreConfig = Field(default_factory=StateStoreConfig)
 
+    def hnsw_params(self) -> HNSWParams:
+        """
+        Resolve HNSW parameters. Unset values come from the size-based defaults
+        when expected_collection_size is set, and are otherwise left to the backend
+        """
+        defaults = DEFAULT_HNSW_PARAMS
+        if self.expected_collection_size > 0:
+            defaults = next(
+                params for max_size, params in HNSW_DEFAULTS_BY_SIZE
+                if max_size is None or self.expected_collection_size < max_size
+            )
+        return HNSWParams(
+            m=self.hnsw_m or defaults.m,
+            construction_ef=self.hnsw_construction_ef or defaults.construction_ef,
+            search_ef=self.hnsw_search_ef or defaults.search_ef,
+        )
+
 class RerankerConfig(BaseSettings):
     enabled: bool = Field(
         default=True,
@@ -213,6 +338,11 @@ class EvaluatorConfig(LLMConfig):
         default=1,
         description="Number of evaluation rounds per test case"
     )
+    max_concurrent_queries: int = Field(
+        default=1,
+        description="Maximum number of dataset queries evaluated concurrently. "
+                    "Values above 1 speed up evaluation but overlapping queries inflate the measured query times"
+    )
 
 class AppConfig(BaseSettings):
     model_config = generate_model_config(
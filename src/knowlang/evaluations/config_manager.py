@@ -25,7 +25,7 @@ class SearchConfigurationManager:
         file_path = self.config_dir / f"{config.name}.json"
         
         with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(config.model_dump(), f, indent=2)
+            f.write(config.model_dump_json(indent=2))
         
         LOG.info(f"Saved search configuration to {file_path}")
     
@@ -1,7 +1,7 @@
-import json
+import asyncio
 import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from rich.console import Console
 from rich.table import Table
 from rich.progress import track
@@ -9,7 +9,7 @@ from rich.progress import track
 from knowlang.evaluations.base import EvaluationRun, QueryEvaluationResult, SearchConfiguration
 from knowlang.evaluations.indexer import QueryManager
 from knowlang.evaluations.metrics import MetricsCalculator
-from knowlang.configs import AppConfig, RerankerConfig 
+from knowlang.configs import AppConfig
 from knowlang.configs.retrieval_config import SearchConfig, MultiStageRetrievalConfig
 from knowlang.search.base import SearchMethodology, SearchResult
 from knowlang.search.search_graph.base import SearchDeps, SearchState
@@ -89,21 +89,19 @@ class CodeSearchEvaluator:
                 )
             )
             
-            # Create reranker config
-            reranker_config = RerankerConfig(
-                enabled=config.reranking_enabled,
-                top_k=config.reranker_top_k,
-                relevance_threshold=config.reranker_threshold,
-            )
+            # Create reranker config from the loaded one instead of re-reading settings sources
+            reranker_config = self.config.reranker.model_copy(update={
+                "enabled": config.reranking_enabled,
+                "top_k": config.reranker_top_k,
+                "relevance_threshold": config.reranker_threshold,
+            })
             
-            # Use the application's existing model configs, but override retrieval and reranker settings
-            eval_config = AppConfig(
-                llm=self.config.llm,  
-                embedding=self.config.embedding,
-                retrieval=retrieval_config,
-                reranker=reranker_config,
-                db=self.config.db  # Keep the same DB config to use the same store
-            )
+            # Use the application's existing model configs, but override retrieval and reranker settings.
+            # A shallow copy keeps the same DB config (and so the same store) without revalidating every section
+            eval_config = self.config.model_copy(update={
+                "retrieval": retrieval_config,
+                "reranker": reranker_config,
+            })
             
             # Create search dependencies
             deps = SearchDeps(
@@ -231,24 +229,40 @@ class CodeSearchEvaluator:
         
         LOG.info(f"Evaluating {len(selected_queries)} queries for {dataset_name} ({language})")
         
-        # Evaluate each query
-        query_results : List[QueryEvaluationResult] = []
-        total_time = 0.0
+        # Queries run one at a time by default so query_time measures a single search;
+        # raising max_concurrent_queries trades timing accuracy for throughput
+        results_by_id: Dict[str, QueryEvaluationResult] = {}
+        semaphore = asyncio.Semaphore(self.config.evaluator.max_concurrent_queries)
         
-        for query_id, data in track(selected_queries.items(), description=f"Evaluating {dataset_name}"):
-            query = data["query"]
-            relevant_code = data.get("relevant_code", [])
-            
-            result = await self.evaluate_query(
-                query_id=query_id,
-                query=query,
-                relevant_code_ids=relevant_code,
-                config=config
-            )
-            LOG.debug(f"Query Evaluation Results: \n{result}")
-            
-            query_results.append(result)
-            total_time += result.query_time
+        async def _evaluate_bounded(query_id: str, data: dict) -> QueryEvaluationResult:
+            async with semaphore:
+                return await self.evaluate_query(
+                    query_id=query_id,
+                    query=data["query"],
+                    relevant_code_ids=data.get("relevant_code", []),
+                    config=config
+                )
+        
+        tasks = [
+            asyncio.ensure_future(_evaluate_bounded(query_id, data))
+            for query_id, data in selected_queries.items()
+        ]
+        try:
+            for next_result in track(asyncio.as_completed(tasks), total=len(tasks), description=f"Evaluating {dataset_name}"):
+                result = await next_result
+                # The result repr includes every retrieved document, so only build it when debug logging is on
+                LOG.debug("Query Evaluation Results: \n%s", result)
+                results_by_id[result.query_id] = result
+        finally:
+            # Stop the remaining searches if a query failed or the evaluation was cancelled,
+            # and retrieve their outcomes so no task exception goes unobserved
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Aggregate in input order so runs do not depend on completion order
+        query_results = [results_by_id[qid] for qid in selected_queries if qid in results_by_id]
+        total_time = sum(r.query_time for r in query_results)
         
         # Aggregate metrics
         num_queries = len(query_results)
@@ -299,7 +313,7 @@ class CodeSearchEvaluator:
         file_path = self.output_dir / file_name
         
         with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(run.model_dump(), f, indent=2)
+            f.write(run.model_dump_json(indent=2))
         
         LOG.info(f"Saved evaluation run to {file_path}")
     
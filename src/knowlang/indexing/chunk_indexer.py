@@ -1,63 +1,241 @@
+import asyncio
 from pathlib import Path
-from typing import List, Set
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 from knowlang.configs import AppConfig
 from knowlang.core.types import CodeChunk, DatabaseChunkMetadata
-from knowlang.indexing.indexing_agent import IndexingAgent
-from knowlang.models import generate_embedding
-from knowlang.utils import FancyLogger
+from knowlang.indexing.indexing_agent import IndexingAgent, build_summary_prompt
+from knowlang.indexing.summary_cache import CachedSummary, SummaryCache
+from knowlang.models import EmbeddingVector, generate_embedding
+from knowlang.utils import FancyLogger, count_tokens
 from knowlang.vector_stores.factory import VectorStoreFactory
 
 LOG = FancyLogger(__name__)
 
+class ChunkRecord(NamedTuple):
+    """Embedded chunk ready to be written to the vector store"""
+    id: str
+    document: str
+    embedding: EmbeddingVector
+    metadata: Dict[str, Any]
+
 class ChunkIndexer:
     """Handles processing of code chunks including summary and embedding generation"""
-    
+
     def __init__(self, config: AppConfig):
         self.config = config
         self.vector_store = VectorStoreFactory.get(config.db, config.embedding)
         self.indexing_agent = IndexingAgent(config)
+        self.summary_cache = SummaryCache(config) if config.parser.enable_summary_cache else None
+
+    async def _summarize_chunk(self, chunk: CodeChunk) -> str:
+        """Get the text to embed for a chunk, summarizing it if enabled"""
+        if self.config.parser.enable_code_summarization:
+            # Get summary from indexing agent
+            return await self.indexing_agent.summarize_chunk(chunk)
+        return chunk.content
+
+    async def _summarize_chunks(self, chunks: List[CodeChunk], prompts: Dict[str, str]) -> List[Union[str, Exception]]:
+        """Summarize chunks with one LLM request, falling back to one request per chunk with its prebuilt prompt"""
+        if not self.config.parser.enable_code_summarization:
+            return [chunk.content for chunk in chunks]
+
+        if len(chunks) > 1:
+            try:
+                return await self.indexing_agent.summarize_chunks_batch(chunks)
+            except Exception as e:
+                LOG.warning(f"Batch summarization of {len(chunks)} chunks failed, summarizing one by one: {e}")
+
+        results: List[Union[str, Exception]] = []
+        for chunk in chunks:
+            try:
+                results.append(await self.indexing_agent.summarize_chunk(
+                    chunk, prompt=prompts.get(chunk.location.to_single_line())
+                ))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _build_summary_prompts(self, chunks: List[CodeChunk]) -> Dict[str, str]:
+        """Build each chunk's single-chunk summary prompt once, keyed by chunk id"""
+        if not self.config.parser.enable_code_summarization:
+            return {}
+        return {chunk.location.to_single_line(): build_summary_prompt(chunk) for chunk in chunks}
+
+    def _pack_summary_batches(self, chunks: List[CodeChunk], prompts: Dict[str, str]) -> List[List[CodeChunk]]:
+        """Group chunks of similar prompt size into batches that fit the token budget"""
+        max_batch_size = max(1, self.config.parser.summarization_batch_size)
+        if not self.config.parser.enable_code_summarization or max_batch_size == 1:
+            return [chunks[i:i + max_batch_size] for i in range(0, len(chunks), max_batch_size)]
+
+        max_batch_tokens = self.config.parser.summarization_max_batch_tokens
+        token_counts = count_tokens(
+            [prompts[chunk.location.to_single_line()] for chunk in chunks],
+            self.config.llm.tokenizer_name
+        )
+
+        # Sorting by size keeps similar-length prompts together; an oversized chunk ends up alone
+        batches: List[List[CodeChunk]] = []
+        current: List[CodeChunk] = []
+        current_tokens = 0
+        for i in sorted(range(len(chunks)), key=token_counts.__getitem__):
+            if current and (len(current) >= max_batch_size or current_tokens + token_counts[i] > max_batch_tokens):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(chunks[i])
+            current_tokens += token_counts[i]
+        if current:
+            batches.append(current)
+
+        return batches
+
+    def _get_embeddings_batch(self, texts: List[str]) -> List[EmbeddingVector]:
+        """Embed texts with a single provider call, falling back to one call per text"""
+        try:
+            embeddings = generate_embedding(texts, self.config.embedding)
+            if len(embeddings) == len(texts):
+                return embeddings
+            LOG.warning(f"Expected {len(texts)} embeddings but got {len(embeddings)}, embedding sequentially")
+        except RuntimeError as e:
+            LOG.warning(f"Batch embedding failed, embedding sequentially: {e}")
+
+        return [generate_embedding(text, self.config.embedding) for text in texts]
+
+    def _embed_records(self, summarized: List[Tuple[CodeChunk, str]]) -> List[ChunkRecord]:
+        """Embed summarized chunks in one batch and build the records to store"""
+        # Identical texts (boilerplate like trivial __init__ methods) share one embedding
+        unique_texts = list(dict.fromkeys(summary for _, summary in summarized))
+        embeddings = dict(zip(unique_texts, self._get_embeddings_batch(unique_texts)))
+        return [
+            self._build_record(chunk, summary, embeddings[summary])
+            for chunk, summary in summarized
+        ]
+
+    def _build_record(self, chunk: CodeChunk, summary: str, embedding: EmbeddingVector) -> ChunkRecord:
+        """Build the vector store record for an embedded chunk"""
+        return ChunkRecord(
+            id=chunk.location.to_single_line(),
+            document=summary,
+            embedding=embedding,
+            metadata=DatabaseChunkMetadata.from_code_chunk(chunk).model_dump()
+        )
+
+    async def _write_records(self, records: List[ChunkRecord]) -> List[str]:
+        """Store records in the vector store with a single write"""
+        await self.vector_store.add_documents(
+            documents=[record.document for record in records],
+            embeddings=[record.embedding for record in records],
+            metadatas=[record.metadata for record in records],
+            ids=[record.id for record in records]
+        )
+        return [record.id for record in records]
+
+    async def _consume_records(self, queue: "asyncio.Queue[Optional[ChunkRecord]]", file_path: Path) -> Set[str]:
+        """Drain records from the queue, writing them in batches of db.add_batch_size"""
+        chunk_ids = set()
+        buffer: List[ChunkRecord] = []
+
+        async def flush() -> None:
+            if not buffer:
+                return
+            try:
+                chunk_ids.update(await self._write_records(buffer))
+            except Exception as e:
+                LOG.error(f"Error storing {len(buffer)} chunks from {file_path}: {e}")
+            buffer.clear()
+
+        # None marks the end of the stream
+        while (record := await queue.get()) is not None:
+            buffer.append(record)
+            if len(buffer) >= self.config.db.add_batch_size:
+                await flush()
+        await flush()
+
+        return chunk_ids
 
     async def process_chunk(self, chunk: CodeChunk) -> str:
         """Process a single chunk and store in vector store"""
         try:
-            if self.config.parser.enable_code_summarization:
-                # Get summary from indexing agent
-                summary = await self.indexing_agent.summarize_chunk(chunk)
-            else:
-                summary = chunk.content
-            
-            # Generate embedding
-            embedding = generate_embedding(summary, self.config.embedding)
-            
-            # Create metadata
-            metadata = DatabaseChunkMetadata.from_code_chunk(chunk)
-            
-            # Create unique ID
-            chunk_id = chunk.location.to_single_line()
-            
-            # Store in vector store
-            await self.vector_store.add_documents(
-                documents=[summary],
-                embeddings=[embedding],
-                metadatas=[metadata.model_dump()],
-                ids=[chunk_id]
-            )
-            
-            return chunk_id
-            
+            summary = await self._summarize_chunk(chunk)
+            records = self._embed_records([(chunk, summary)])
+            chunk_ids = await self._write_records(records)
+            return chunk_ids[0]
+
         except Exception as e:
             LOG.error(f"Error processing chunk {chunk.location}: {e}")
             raise
 
-    async def process_file_chunks(self, file_path: Path, chunks: List[CodeChunk]) -> Set[str]:
-        """Process all chunks from a single file"""
-        chunk_ids = set()
-        for chunk in chunks:
-            try:
-                chunk_id = await self.process_chunk(chunk)
-                chunk_ids.add(chunk_id)
-            except Exception as e:
-                LOG.error(f"Error processing chunk in {file_path}: {e}")
+    async def process_file_chunks(
+        self,
+        file_path: Path,
+        chunks: List[CodeChunk],
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Set[str]:
+        """
+        Process all chunks from a single file.
+        Pass a shared semaphore to bound LLM requests across files processed concurrently.
+        """
+        # Unchanged chunks reuse their cached summary and embedding
+        cache_keys: Dict[str, str] = {}
+        cached_records: List[ChunkRecord] = []
+        if self.summary_cache:
+            cache_keys = {chunk.location.to_single_line(): self.summary_cache.compute_key(chunk) for chunk in chunks}
+            hits = await asyncio.to_thread(self.summary_cache.get_many, list(cache_keys.values()))
+            pending = []
+            for chunk in chunks:
+                hit = hits.get(cache_keys[chunk.location.to_single_line()])
+                if hit:
+                    cached_records.append(self._build_record(chunk, hit.summary, hit.embedding))
+                else:
+                    pending.append(chunk)
+            LOG.debug("Summary cache hits for %s: %d/%d", file_path, len(cached_records), len(chunks))
+            chunks = pending
+
+        semaphore = semaphore or asyncio.Semaphore(self.config.llm.max_concurrent)
+        # The packer counts the same prompts that single-chunk requests send
+        prompts = self._build_summary_prompts(chunks)
+        chunk_batches = self._pack_summary_batches(chunks, prompts)
+
+        async def _summarize_bounded(batch: List[CodeChunk]) -> List[Union[str, Exception]]:
+            async with semaphore:
+                return await self._summarize_chunks(batch, prompts)
+
+        # Summaries are bound by LLM latency, so overlap them up to the provider limit
+        batch_results = await asyncio.gather(*[_summarize_bounded(batch) for batch in chunk_batches])
+
+        summarized: List[Tuple[CodeChunk, str]] = []
+        for chunk, result in zip(
+            (chunk for batch in chunk_batches for chunk in batch),
+            (result for batch in batch_results for result in batch)
+        ):
+            if isinstance(result, Exception):
+                LOG.error(f"Error processing chunk in {file_path}: {result}")
                 continue
-        return chunk_ids
\ No newline at end of file
+            summarized.append((chunk, result))
+
+        # Embed on a worker thread while the consumer writes completed batches
+        queue: asyncio.Queue[Optional[ChunkRecord]] = asyncio.Queue()
+        consumer = asyncio.create_task(self._consume_records(queue, file_path))
+        try:
+            for record in cached_records:
+                await queue.put(record)
+
+            batch_size = self.config.embedding.batch_size
+            for i in range(0, len(summarized), batch_size):
+                batch = summarized[i:i + batch_size]
+                try:
+                    records = await asyncio.to_thread(self._embed_records, batch)
+                except Exception as e:
+                    LOG.error(f"Error embedding {len(batch)} chunks from {file_path}: {e}")
+                    continue
+                if self.summary_cache:
+                    await asyncio.to_thread(self.summary_cache.put_many, {
+                        cache_keys[record.id]: CachedSummary(summary=record.document, embedding=record.embedding)
+                        for record in records
+                    })
+                for record in records:
+                    await queue.put(record)
+        finally:
+            await queue.put(None)
+
+        return await consumer
@@ -1,3 +1,4 @@
+import asyncio
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
@@ -52,6 +53,56 @@ class IncrementalUpdater:
             chunks_by_file[chunk.location.file_path].append(chunk)
         return dict(chunks_by_file)
 
+    async def _process_change(
+        self,
+        change: FileChange,
+        chunks_by_file: Dict[str, List[CodeChunk]],
+        stats: UpdateStats,
+        llm_semaphore: asyncio.Semaphore
+    ) -> None:
+        """Apply a single file change, writing its file state once the file is indexed"""
+        try:
+            # Handle deletions and modifications (remove old chunks)
+            if change.change_type in (StateChangeType.MODIFIED, StateChangeType.DELETED):
+                old_state = await self.state_manager.get_file_state(change.path)
+                if old_state and old_state.chunk_ids:
+                    stats.chunks_deleted += len(old_state.chunk_ids)
+                    await self.state_manager.delete_file_state(change.path)
+            
+            # Handle additions and modifications (add new chunks)
+            if change.change_type in (StateChangeType.ADDED, StateChangeType.MODIFIED):
+                change_path_str = convert_to_relative_path(change.path, self.app_config.db)
+                if change_path_str in chunks_by_file:
+                    file_chunks = chunks_by_file[change_path_str]
+                    chunk_ids = await self.chunk_indexer.process_file_chunks(
+                        change.path, 
+                        file_chunks,
+                        semaphore=llm_semaphore
+                    )
+                    
+                    if chunk_ids:
+                        new_state = await self.codebase_manager.create_file_state(
+                            change.path,
+                            chunk_ids
+                        )
+                        await self.state_manager.update_file_state(
+                            change.path,
+                            new_state
+                        )
+                        stats.chunks_added += len(chunk_ids)
+            
+            # Update stats
+            if change.change_type == StateChangeType.ADDED:
+                stats.files_added += 1
+            elif change.change_type == StateChangeType.MODIFIED:
+                stats.files_modified += 1
+            elif change.change_type == StateChangeType.DELETED:
+                stats.files_deleted += 1
+            
+        except Exception as e:
+            LOG.error(f"Error processing change for {change.path}: {e}")
+            stats.errors += 1
+
     async def process_changes(
         self,
         changes: List[FileChange],
@@ -61,48 +112,20 @@ class IncrementalUpdater:
         stats = UpdateStats()
         chunks_by_file = self._group_chunks_by_file(chunks)
         
-        for change in track(changes, description="Processing code changes"):
-            try:
-                # Handle deletions and modifications (remove old chunks)
-                if change.change_type in (StateChangeType.MODIFIED, StateChangeType.DELETED):
-                    old_state = await self.state_manager.get_file_state(change.path)
-                    if old_state and old_state.chunk_ids:
-                        stats.chunks_deleted += len(old_state.chunk_ids)
-                        await self.state_manager.delete_file_state(change.path)
-                
-                # Handle additions and modifications (add new chunks)
-                if change.change_type in (StateChangeType.ADDED, StateChangeType.MODIFIED):
-                    change_path_str = convert_to_relative_path(change.path, self.app_config.db)
-                    if change_path_str in chunks_by_file:
-                        file_chunks = chunks_by_file[change_path_str]
-                        chunk_ids = await self.chunk_indexer.process_file_chunks(
-                            change.path, 
-                            file_chunks
-                        )
-                        
-                        if chunk_ids:
-                            new_state = await self.codebase_manager.create_file_state(
-                                change.path,
-                                chunk_ids
-                            )
-                            await self.state_manager.update_file_state(
-                                change.path,
-                                new_state
-                            )
-                            stats.chunks_added += len(chunk_ids)
-                
-                # Update stats
-                if change.change_type == StateChangeType.ADDED:
-                    stats.files_added += 1
-                elif change.change_type == StateChangeType.MODIFIED:
-                    stats.files_modified += 1
-                elif change.change_type == StateChangeType.DELETED:
-                    stats.files_deleted += 1
-                
-            except Exception as e:
-                LOG.error(f"Error processing change for {change.path}: {e}")
-                stats.errors += 1
-                continue
+        # Files are processed concurrently so small files also keep the LLM busy.
+        # LLM requests share one semaphore across files, and a second one bounds
+        # the files in flight (a single semaphore would deadlock on nested acquires)
+        max_concurrent = self.app_config.llm.max_concurrent
+        llm_semaphore = asyncio.Semaphore(max_concurrent)
+        file_semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def _process_bounded(change: FileChange) -> None:
+            async with file_semaphore:
+                await self._process_change(change, chunks_by_file, stats, llm_semaphore)
+        
+        tasks = [asyncio.ensure_future(_process_bounded(change)) for change in changes]
+        for next_change in track(asyncio.as_completed(tasks), total=len(tasks), description="Processing code changes"):
+            await next_change
         
         LOG.info(stats.summary())
         return stats
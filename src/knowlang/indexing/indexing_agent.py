@@ -1,3 +1,6 @@
+import hashlib
+from typing import List, Optional
+from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 from knowlang.configs import AppConfig
 from knowlang.core.types import CodeChunk
@@ -10,23 +13,7 @@ from knowlang.vector_stores.factory import VectorStoreFactory
 
 LOG = FancyLogger(__name__)
 
-
-class IndexingAgent:
-    def __init__(
-        self, 
-        config: AppConfig,
-    ):
-        """
-        Initialize IndexingAgent with config and optional vector store.
-        If vector store is not provided, creates one based on config.
-        """
-        self.config = config
-        self.vector_store = VectorStoreFactory.get(config.db, config.embedding)
-        self._init_agent()
-
-    def _init_agent(self):
-        """Initialize the LLM agent with configuration"""
-        system_prompt = """
+_SYSTEM_PROMPT = """
 You are an expert code analyzer specializing in creating searchable and contextual code summaries. 
 Your summaries will be used in a RAG system to help developers understand complex codebases.
 Focus on following points:
@@ -44,28 +31,140 @@ Focus on following points:
         
 Provide a clean, concise and focused summary. Don't include unnecessary nor generic details.
 """
-        
-        self.agent = Agent(
-            create_pydantic_model(
-                model_provider=self.config.llm.model_provider,
-                model_name=self.config.llm.model_name
-            ),
-            system_prompt=system_prompt,
-            model_settings=self.config.llm.model_settings
-        )
 
-    async def summarize_chunk(self, chunk: CodeChunk) -> str:
-        """Summarize a single code chunk using the LLM"""
-        prompt = f"""
-        Analyze this {chunk.type.value} code chunk:
+_SUMMARY_PROMPT_TEMPLATE = """
+        Analyze this {chunk_type} code chunk:
         
-        {chunk.content}
+        {content}
         
-        {f'Docstring: {chunk.docstring}' if chunk.docstring else ''}
+        {docstring}
         
         Provide a concise summary.
+        """.format
+
+_BATCH_SECTION_TEMPLATE = "Chunk {index} ({chunk_type}):\n{content}{docstring}".format
+
+_BATCH_PROMPT_TEMPLATE = (
+    "Analyze each of the following {count} code chunks independently.\n\n"
+    "{chunk_sections}"
+    "\n\nProvide a concise summary for every chunk, using its chunk number as the index."
+).format
+
+# Changes to any prompt give new summary cache keys, so stale summaries are not reused.
+# The templates are bound str.format methods, so hash the strings they are bound to
+SUMMARY_PROMPT_FINGERPRINT = hashlib.sha256("\0".join((
+    _SYSTEM_PROMPT,
+    _SUMMARY_PROMPT_TEMPLATE.__self__,
+    _BATCH_SECTION_TEMPLATE.__self__,
+    _BATCH_PROMPT_TEMPLATE.__self__,
+)).encode("utf-8")).hexdigest()
+
+
+def build_summary_prompt(chunk: CodeChunk) -> str:
+    """Build the prompt used to summarize a single chunk"""
+    return _SUMMARY_PROMPT_TEMPLATE(
+        chunk_type=chunk.type.value,
+        content=chunk.content,
+        docstring=f'Docstring: {chunk.docstring}' if chunk.docstring else '',
+    )
+
+
+def build_batch_summary_prompt(chunks: List[CodeChunk]) -> str:
+    """Build the prompt used to summarize several chunks in one request"""
+    chunk_sections = "\n\n".join(
+        _BATCH_SECTION_TEMPLATE(
+            index=i,
+            chunk_type=chunk.type.value,
+            content=chunk.content,
+            docstring=f'\nDocstring: {chunk.docstring}' if chunk.docstring else '',
+        )
+        for i, chunk in enumerate(chunks)
+    )
+    return _BATCH_PROMPT_TEMPLATE(count=len(chunks), chunk_sections=chunk_sections)
+
+
+class SummaryOutput(BaseModel):
+    """Structured summary of a code chunk, validated once by pydantic-ai"""
+    summary: str = Field(description="Concise summary of the chunk's purpose and functionality")
+    key_points: List[str] = Field(
+        default_factory=list,
+        description="Key implementation details, algorithms or design choices"
+    )
+    dependencies: List[str] = Field(
+        default_factory=list,
+        description="Related classes/functions by exact name and external dependencies"
+    )
+
+    def to_text(self) -> str:
+        """Render the summary as the text stored alongside the code"""
+        lines = [self.summary]
+        if self.key_points:
+            lines.append("Key points:")
+            lines.extend(f"- {point}" for point in self.key_points)
+        if self.dependencies:
+            lines.append("Dependencies:")
+            lines.extend(f"- {dependency}" for dependency in self.dependencies)
+        return "\n".join(lines)
+
+
+class ChunkSummary(SummaryOutput):
+    """Summary of one chunk within a batched summarization request"""
+    index: int = Field(description="Number of the chunk as given in the prompt")
+
+
+class IndexingAgent:
+    def __init__(
+        self, 
+        config: AppConfig,
+    ):
         """
-        
-        result = await self.agent.run(prompt)
+        Initialize IndexingAgent with config and optional vector store.
+        If vector store is not provided, creates one based on config.
+        """
+        self.config = config
+        self.vector_store = VectorStoreFactory.get(config.db, config.embedding)
+        self._init_agent()
+
+    def _init_agent(self):
+        """Initialize the LLM agent with configuration"""
+        model = create_pydantic_model(
+            model_provider=self.config.llm.model_provider,
+            model_name=self.config.llm.model_name
+        )
+        self.agent = Agent(
+            model,
+            result_type=SummaryOutput,
+            system_prompt=_SYSTEM_PROMPT,
+            model_settings=self.config.llm.model_settings
+        )
+        self.batch_agent = Agent(
+            model,
+            result_type=List[ChunkSummary],
+            system_prompt=_SYSTEM_PROMPT,
+            model_settings=self.config.llm.model_settings
+        )
+
+    async def summarize_chunk(self, chunk: CodeChunk, prompt: Optional[str] = None) -> str:
+        """Summarize a single code chunk using the LLM, reusing its prompt if already built"""
+        result = await self.agent.run(prompt or build_summary_prompt(chunk))
+
+        return format_code_summary(chunk.content, result.data.to_text())
+
+    async def summarize_chunks_batch(self, chunks: List[CodeChunk]) -> List[str]:
+        """Summarize several code chunks with a single LLM request
+
+        Raises:
+            ValueError: If the LLM does not return exactly one summary per chunk
+        """
+        result = await self.batch_agent.run(build_batch_summary_prompt(chunks))
+
+        summaries = {item.index: item for item in result.data}
+        if sorted(summaries) != list(range(len(chunks))):
+            raise ValueError(
+                f"Expected summaries for chunks 0-{len(chunks) - 1}, got indices {sorted(summaries)}"
+            )
 
-        return format_code_summary(chunk.content, result.data)
\ No newline at end of file
+        return [
+            format_code_summary(chunk.content, summaries[i].to_text())
+            for i, chunk in enumerate(chunks)
+        ]
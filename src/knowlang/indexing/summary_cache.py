@@ -0,0 +1,96 @@
+import hashlib
+from typing import Dict, List, NamedTuple
+
+from sqlalchemy import JSON, Column, String, Text, create_engine, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from knowlang.configs import AppConfig, ModelProvider
+from knowlang.core.types import CodeChunk
+from knowlang.indexing.indexing_agent import SUMMARY_PROMPT_FINGERPRINT
+from knowlang.models import EmbeddingVector
+from knowlang.utils import FancyLogger
+
+LOG = FancyLogger(__name__)
+Base = declarative_base()
+
+SUMMARY_CACHE_FILENAME = "summary_cache.db"
+# Bump when summaries or embeddings change in ways the cache key cannot see,
+# such as how structured summaries are rendered to text
+SUMMARY_CACHE_VERSION = "1"
+
+class SummaryCacheModel(Base):
+    """SQLAlchemy model for cached chunk summaries and their embeddings"""
+    __tablename__ = 'summary_cache'
+
+    content_hash = Column(String, primary_key=True)
+    summary = Column(Text)
+    embedding = Column(JSON)
+
+class CachedSummary(NamedTuple):
+    """Summary and embedding previously generated for a chunk"""
+    summary: str
+    embedding: EmbeddingVector
+
+class SummaryCache:
+    """Persistent cache mapping chunk content hashes to their summary and embedding"""
+
+    def __init__(self, config: AppConfig):
+        self.config = config
+        cache_path = config.db.persist_directory / SUMMARY_CACHE_FILENAME
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.engine = create_engine(f"sqlite:///{cache_path}")
+        self.Session = sessionmaker(bind=self.engine)
+        Base.metadata.create_all(self.engine)
+
+    def compute_key(self, chunk: CodeChunk) -> str:
+        """Hash everything that determines a chunk's summary and embedding"""
+        summarizer = (
+            f"{self.config.llm.model_provider}:{self.config.llm.model_name}:{SUMMARY_PROMPT_FINGERPRINT}"
+            if self.config.parser.enable_code_summarization else "none"
+        )
+        embedding = self.config.embedding
+        embedder = f"{embedding.model_provider}:{embedding.resolved_model_name}"
+        # A TEI server embeds with whatever model it was launched with, so the server is part of the embedder
+        if embedding.model_provider == ModelProvider.TEI:
+            embedder = f"{embedder}@{embedding.tei_url}"
+
+        sha256_hash = hashlib.sha256()
+        for part in (SUMMARY_CACHE_VERSION, summarizer, embedder, chunk.content, chunk.docstring or ""):
+            sha256_hash.update(part.encode("utf-8"))
+            sha256_hash.update(b"\0")
+        return sha256_hash.hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, CachedSummary]:
+        """Get cached entries for the given keys, skipping misses"""
+        if not keys:
+            return {}
+        try:
+            with self.Session() as session:
+                rows = session.execute(
+                    select(SummaryCacheModel).where(SummaryCacheModel.content_hash.in_(keys))
+                ).scalars()
+                return {
+                    row.content_hash: CachedSummary(summary=row.summary, embedding=row.embedding)
+                    for row in rows
+                }
+        except SQLAlchemyError as e:
+            LOG.warning(f"Error reading summary cache: {e}")
+            return {}
+
+    def put_many(self, entries: Dict[str, CachedSummary]) -> None:
+        """Store entries, replacing any existing entry with the same key"""
+        if not entries:
+            return
+        try:
+            with self.Session() as session:
+                for key, entry in entries.items():
+                    session.merge(SummaryCacheModel(
+                        content_hash=key,
+                        summary=entry.summary,
+                        embedding=entry.embedding
+                    ))
+                session.commit()
+        except SQLAlchemyError as e:
+            LOG.warning(f"Error writing summary cache: {e}")
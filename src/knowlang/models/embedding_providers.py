@@ -1,14 +1,17 @@
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional 
-from knowlang.configs import ModelProvider
+from knowlang.configs import EmbeddingConfig, ModelProvider
 
 from .types import EmbeddingInputType, EmbeddingVector
 
+ProviderFunction = Callable[[List[str], str, Optional[EmbeddingInputType], EmbeddingConfig], List[EmbeddingVector]]
+
 # Global registry for provider functions
-EMBEDDING_PROVIDER_REGISTRY: Dict[ModelProvider, Callable[[List[str], str, Optional[EmbeddingInputType]], List[EmbeddingVector]]] = {}
+EMBEDDING_PROVIDER_REGISTRY: Dict[ModelProvider, ProviderFunction] = {}
 
 def register_provider(provider: ModelProvider):
     """Decorator to register a provider function."""
-    def decorator(func: Callable[[List[str], str, Optional[EmbeddingInputType]], List[EmbeddingVector]]):
+    def decorator(func: ProviderFunction):
         EMBEDDING_PROVIDER_REGISTRY[provider] = func
         return func
     return decorator
@@ -19,6 +22,7 @@ def _process_graph_code_bert_batch(
     inputs: List[str], 
     model_name: str, 
     input_type: Optional[EmbeddingInputType] = None,
+    config: Optional[EmbeddingConfig] = None,
 ) -> List[EmbeddingVector]:
     """
     Generate embeddings using GraphCodeBERT.
@@ -27,6 +31,7 @@ def _process_graph_code_bert_batch(
         inputs: List of text inputs to embed
         model_name: Model identifier
         input_type: Type of input (document/query/code)
+        config: Embedding configuration
     
     Returns:
         List of embedding vectors
@@ -37,19 +42,47 @@ def _process_graph_code_bert_batch(
     return generate_embeddings(inputs)
 
 @register_provider(ModelProvider.OLLAMA)
-def _process_ollama_batch(inputs: List[str], model_name: str, _: Optional[EmbeddingInputType] = None) -> List[EmbeddingVector]:
+def _process_ollama_batch(inputs: List[str], model_name: str, _: Optional[EmbeddingInputType] = None, config: Optional[EmbeddingConfig] = None) -> List[EmbeddingVector]:
     import ollama
     return ollama.embed(model=model_name, input=inputs)['embeddings']
 
 @register_provider(ModelProvider.OPENAI)
-def _process_openai_batch(inputs: List[str], model_name: str, _: Optional[EmbeddingInputType] = None) -> List[EmbeddingVector]:
+def _process_openai_batch(inputs: List[str], model_name: str, _: Optional[EmbeddingInputType] = None, config: Optional[EmbeddingConfig] = None) -> List[EmbeddingVector]:
     import openai
     response = openai.embeddings.create(input=inputs, model=model_name)
     return [item.embedding for item in response.data]
 
-@register_provider(ModelProvider.VOYAGE)
-def _process_voyage_batch(inputs: List[str], model_name: str, input_type: Optional[EmbeddingInputType]) -> List[EmbeddingVector]:
+@lru_cache(maxsize=1)
+def _get_voyage_client():
+    """Create a VoyageAI client once so its HTTP session is reused across calls."""
     import voyageai
-    client = voyageai.Client()
+    return voyageai.Client()
+
+@register_provider(ModelProvider.VOYAGE)
+def _process_voyage_batch(inputs: List[str], model_name: str, input_type: Optional[EmbeddingInputType], config: Optional[EmbeddingConfig] = None) -> List[EmbeddingVector]:
+    client = _get_voyage_client()
     embeddings_obj = client.embed(model=model_name, texts=inputs, input_type=input_type.value)
-    return embeddings_obj.embeddings
\ No newline at end of file
+    return embeddings_obj.embeddings
+
+@lru_cache(maxsize=8)
+def _get_tei_client(base_url: str):
+    """Create a keep-alive HTTP client for a text-embeddings-inference server, with caching."""
+    import httpx
+    return httpx.Client(base_url=base_url, timeout=60.0)
+
+@register_provider(ModelProvider.TEI)
+def _process_tei_batch(inputs: List[str], model_name: str, _: Optional[EmbeddingInputType], config: EmbeddingConfig) -> List[EmbeddingVector]:
+    """
+    Generate embeddings with a HuggingFace text-embeddings-inference server.
+    The model is chosen when the server is launched, so model_name is not sent.
+    """
+    client = _get_tei_client(config.tei_url)
+
+    # TEI rejects requests holding more inputs than its --max-client-batch-size
+    embeddings: List[EmbeddingVector] = []
+    batch_size = config.tei_max_client_batch_size
+    for i in range(0, len(inputs), batch_size):
+        response = client.post("/embed", json={"inputs": inputs[i:i + batch_size], "truncate": True})
+        response.raise_for_status()
+        embeddings.extend(response.json())
+    return embeddings
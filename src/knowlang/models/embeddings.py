@@ -44,7 +44,7 @@ def generate_embedding(
         raise ValueError(f"Unsupported provider: {config.model_provider}")
 
     try:
-        embeddings = provider_function(inputs, config.model_name, input_type)
+        embeddings = provider_function(inputs, config.resolved_model_name, input_type, config)
         return embeddings[0] if isinstance(input, str) else embeddings
     except Exception as e:
         raise RuntimeError(f"Failed to generate embeddings: {str(e)}") from e
\ No newline at end of file
@@ -14,6 +14,8 @@ class GraphCodeBertMode(str, Enum):
     CROSS_ENCODER = "cross-encoder"
 
 GRAPH_CODE_BERT_MAX_LENGTH = 512
+GRAPH_CODE_BERT_SCORING_BATCH_SIZE = 16
+GRAPH_CODE_BERT_CROSS_ENCODER_PATH = "microsoft/graphcodebert-base"
 
 @lru_cache(maxsize=8)
 def _get_model_and_tokenizer(
@@ -95,35 +97,49 @@ def generate_embeddings(
     
     return embeddings
 
+def load_cross_encoder() -> Tuple[Any, Any, str]:
+    """
+    Load the cross-encoder used for relevance scoring.
+    Later calls return the cached model, so this can be used to warm it up.
+    
+    Returns:
+        Tuple of (model, tokenizer, device)
+    """
+    return _get_model_and_tokenizer(
+        GRAPH_CODE_BERT_CROSS_ENCODER_PATH,
+        GraphCodeBertMode.CROSS_ENCODER,
+        None
+    )
+
 def calculate_relevance_scores(
     query: str,
     code_snippets: List[str],
+    batch_size: int = GRAPH_CODE_BERT_SCORING_BATCH_SIZE,
 ) -> List[float]:
     """
     Score query-code pairs using GraphCodeBERT in cross-encoder mode.
+    Pairs are scored in batches so each batch needs a single forward pass.
     
     Args:
         query: Natural language query
         code_snippets: List of code snippets to score
+        batch_size: Number of query-code pairs per forward pass
         
     Returns:
         List of similarity scores for each query-code pair
     """
-    model, tokenizer, device = _get_model_and_tokenizer(
-        "microsoft/graphcodebert-base",
-        GraphCodeBertMode.CROSS_ENCODER,
-        None
-    )
+    model, tokenizer, device = load_cross_encoder()
     
     scores = []
     
     with torch.no_grad():
-        for code in code_snippets:
-            # Tokenize query and code as a pair
+        for i in range(0, len(code_snippets), batch_size):
+            batch = code_snippets[i:i + batch_size]
+            # Tokenize query and code as pairs, padding only to the longest pair in the batch
             inputs = tokenizer(
-                query,
-                code,
-                padding="max_length",
+                [query] * len(batch),
+                batch,
+                padding=True,
                 truncation=True,
                 max_length=GRAPH_CODE_BERT_MAX_LENGTH,
                 return_tensors="pt"
@@ -132,8 +148,7 @@ def calculate_relevance_scores(
             # Get model output
             outputs = model(**inputs)
             
-            # Get score (logit)
-            score = outputs.logits.item()
-            scores.append(score)
+            # One score (logit) per pair
+            scores.extend(outputs.logits.squeeze(-1).tolist())
     
-    return scores
\ No newline at end of file
+    return scores
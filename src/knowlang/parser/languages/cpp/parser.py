@@ -128,7 +128,7 @@ class CppParser(LanguageParser):
     def parse_file(self, file_path: Path) -> List[CodeChunk]:
         """Parse a single C++ file and return list of code chunks"""
         if not self.supports_extension(file_path.suffix):
-            LOG.debug(f"Skipping file {file_path}: unsupported extension")
+            LOG.debug("Skipping file %s: unsupported extension", file_path)
             return []
 
         try:
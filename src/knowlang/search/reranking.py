@@ -13,6 +13,14 @@ class GraphCodeBertReranker:
             config: Reranker configuration
         """
         self.config = config
+    
+    def warm_up(self) -> None:
+        """Load the cross-encoder model ahead of the first rerank request"""
+        if not self.config.enabled:
+            return
+        
+        from knowlang.models.graph_code_bert import load_cross_encoder
+        load_cross_encoder()
         
     def rerank(
         self, 
@@ -1,5 +1,5 @@
-from .chunking_util import (convert_to_relative_path, format_code_summary,
-                            truncate_chunk)
+from .chunking_util import (convert_to_relative_path, count_tokens,
+                            format_code_summary, truncate_chunk)
 from .fancy_log import FancyLogger
 from .model_provider import create_pydantic_model
 from .rate_limiter import RateLimiter
@@ -7,6 +7,7 @@ from .rate_limiter import RateLimiter
 __all__ = [
     "convert_to_relative_path",
     "truncate_chunk",
+    "count_tokens",
     "format_code_summary",
     "FancyLogger",
     "create_pydantic_model",
@@ -1,8 +1,14 @@
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, List, Optional
 
 from knowlang.configs import DBConfig
+from knowlang.utils.fancy_log import FancyLogger
+
+LOG = FancyLogger(__name__)
 
 MAX_CHARS_PER_CHUNK = 10000  # Approximate 8k tokens limit (very rough estimate)
+CHARS_PER_TOKEN = 4  # Rough average for code and English text
 
 
 def convert_to_relative_path(path: Path, db_config: DBConfig) -> str:
@@ -36,4 +42,21 @@ def truncate_chunk(text: str, max_chars: int = MAX_CHARS_PER_CHUNK) -> str:
     truncated_code = code[:code_chars]
     truncated_summary = summary[:summary_chars]
     
-    return f"{truncated_code}\nSUMMARY:\n{truncated_summary}"
\ No newline at end of file
+    return f"{truncated_code}\nSUMMARY:\n{truncated_summary}"
+
+@lru_cache(maxsize=4)
+def _get_tokenizer(tokenizer_name: str) -> Optional[Any]:
+    """Load a HuggingFace tokenizer once, returning None if it is unavailable"""
+    try:
+        from tokenizers import Tokenizer
+        return Tokenizer.from_pretrained(tokenizer_name)
+    except Exception as e:
+        LOG.warning(f"Could not load tokenizer {tokenizer_name}, estimating token counts instead: {e}")
+        return None
+
+def count_tokens(texts: List[str], tokenizer_name: Optional[str] = None) -> List[int]:
+    """Count tokens of each text with the given tokenizer, or estimate them from character counts"""
+    tokenizer = _get_tokenizer(tokenizer_name) if tokenizer_name else None
+    if tokenizer is None:
+        return [len(text) // CHARS_PER_TOKEN + 1 for text in texts]
+    return [len(encoding.ids) for encoding in tokenizer.encode_batch(texts, add_special_tokens=False)]
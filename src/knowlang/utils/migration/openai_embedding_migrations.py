@@ -97,11 +97,11 @@ async def prepare_batches(config: AppConfig, batch_state: BatchState) -> List[st
                 batch_state.save_batch_metadata(f"batch_{current_batch_num}", batch_metadata)
                 
                 batch_ids.append(f"batch_{current_batch_num}")
+                # Advance once per written batch rather than once per document
+                progress.advance(task, len(current_batch))
                 current_batch = []
                 current_batch_ids = []
                 current_batch_num += 1
-            
-            progress.advance(task)
     
     return batch_ids
 
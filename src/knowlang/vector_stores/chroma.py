@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Literal, Optional, Tuple
 from chromadb.config import Settings
 
 import chromadb
-from knowlang.configs import DBConfig, EmbeddingConfig
+from knowlang.configs import DEFAULT_HNSW_PARAMS, DBConfig, EmbeddingConfig, HNSWParams
 from knowlang.core.types import VectorStoreProvider
 from knowlang.vector_stores.base import SearchResult, VectorStore, VectorStoreInitError
 from knowlang.vector_stores.factory import register_vector_store
@@ -22,7 +22,8 @@ class ChromaVectorStore(VectorStore):
         return cls(
             persist_directory=config.persist_directory,
             collection_name=config.collection_name,
-            similarity_metric=config.similarity_metric
+            similarity_metric=config.similarity_metric,
+            hnsw_params=config.hnsw_params()
         )
 
     def accumulate_result(
@@ -45,11 +46,13 @@ class ChromaVectorStore(VectorStore):
         self, 
         persist_directory: Path,
         collection_name: str,
-        similarity_metric: Literal['cosine'] = 'cosine'
+        similarity_metric: Literal['cosine'] = 'cosine',
+        hnsw_params: Optional[HNSWParams] = None
     ):
         self.persist_directory = persist_directory
         self.collection_name = collection_name
         self.similarity_metric = similarity_metric
+        self.hnsw_params = hnsw_params or DEFAULT_HNSW_PARAMS
         self.client = None
         self.collection = None
 
@@ -63,9 +66,19 @@ class ChromaVectorStore(VectorStore):
                     allow_reset=True
                 )
             )
+            # HNSW parameters only take effect when the collection is first created.
+            # Unset ones are left out so Chroma applies its own defaults
+            hnsw_metadata = {
+                "hnsw:M": self.hnsw_params.m,
+                "hnsw:construction_ef": self.hnsw_params.construction_ef,
+                "hnsw:search_ef": self.hnsw_params.search_ef,
+            }
             self.collection = self.client.get_or_create_collection(
                 name=self.collection_name,
-                metadata={"hnsw:space": self.similarity_metric}
+                metadata={
+                    "hnsw:space": self.similarity_metric,
+                    **{key: value for key, value in hnsw_metadata.items() if value is not None},
+                }
             )
         except Exception as e:
             raise VectorStoreInitError(f"Failed to initialize ChromaDB: {str(e)}") from e
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 import vecs
+from sqlalchemy import text
 from vecs.collection import Record
 
-from knowlang.configs import DBConfig, EmbeddingConfig
+from knowlang.configs import DEFAULT_HNSW_PARAMS, DBConfig, EmbeddingConfig, HNSWParams
 from knowlang.utils import FancyLogger
 from knowlang.vector_stores.base import (SearchResult, VectorStore,
                                          VectorStoreError,
@@ -25,7 +26,9 @@ class PostgresVectorStore(VectorStore):
             table_name=config.collection_name,
             embedding_dim=embedding_config.dimension,
             similarity_metric=config.similarity_metric,
-            content_field=config.content_field
+            content_field=config.content_field,
+            hnsw_params=config.hnsw_params(),
+            half_precision=config.half_precision_index
         )
 
     def __init__(
@@ -34,7 +37,9 @@ class PostgresVectorStore(VectorStore):
         table_name: str,
         embedding_dim: int,
         similarity_metric: Literal['cosine'] = 'cosine',
-        content_field: Optional[str] = 'content'
+        content_field: Optional[str] = 'content',
+        hnsw_params: Optional[HNSWParams] = None,
+        half_precision: bool = False
     ):
         super().__init__()
 
@@ -43,6 +48,8 @@ class PostgresVectorStore(VectorStore):
         self.embedding_dim = embedding_dim
         self.similarity_metric = similarity_metric
         self.content_field = content_field
+        self.hnsw_params = hnsw_params or DEFAULT_HNSW_PARAMS
+        self.half_precision = half_precision
         self.collection = None
 
     def initialize(self) -> None:
@@ -54,12 +61,42 @@ class PostgresVectorStore(VectorStore):
         except Exception as e:
             raise VectorStoreInitError(f"Failed to initialize PostgresVectorStore: {str(e)}") from e
         
-        try:
-            self.collection.create_index(measure=self.measure(), replace=False)
-        except Exception as e:
-            # index already exists, ignore
+        if self.half_precision:
+            self._create_half_precision_index()
+            return
+        
+        if self.collection.index is not None:
             LOG.info(f"Index already exists for collection {self.table_name}")
             return
+        
+        # Let vecs pick the index type (ivfflat on pgvector < 0.5) unless HNSW parameters were set
+        method = vecs.IndexMethod.auto
+        index_arguments = None
+        hnsw_arguments = self._hnsw_index_arguments()
+        if hnsw_arguments:
+            if self.collection.client._supports_hnsw():
+                method = vecs.IndexMethod.hnsw
+                index_arguments = vecs.IndexArgsHNSW(**hnsw_arguments)
+            else:
+                LOG.warning(f"pgvector does not support HNSW, ignoring HNSW parameters for {self.table_name}")
+        
+        try:
+            self.collection.create_index(
+                measure=self.measure(),
+                method=method,
+                index_arguments=index_arguments,
+                replace=False
+            )
+        except Exception as e:
+            LOG.error(f"Failed to create index for collection {self.table_name}: {e}")
+
+    def _hnsw_index_arguments(self) -> Dict[str, int]:
+        """Get the HNSW build arguments that were explicitly set, keyed by their pgvector names"""
+        arguments = {
+            "m": self.hnsw_params.m,
+            "ef_construction": self.hnsw_params.construction_ef,
+        }
+        return {key: value for key, value in arguments.items() if value is not None}
 
     def measure(self) -> vecs.IndexMeasure:
         if "cosine" in self.similarity_metric:
@@ -72,6 +109,63 @@ class PostgresVectorStore(VectorStore):
             return vecs.IndexMeasure.max_inner_product
         raise VectorStoreError(f"Unsupported similarity metric: {self.similarity_metric}")
 
+    def _half_precision_ops(self) -> Tuple[str, str]:
+        """Get the pgvector halfvec operator class and distance operator for the similarity metric"""
+        ops = {
+            vecs.IndexMeasure.cosine_distance: ("halfvec_cosine_ops", "<=>"),
+            vecs.IndexMeasure.l1_distance: ("halfvec_l1_ops", "<+>"),
+            vecs.IndexMeasure.l2_distance: ("halfvec_l2_ops", "<->"),
+            vecs.IndexMeasure.max_inner_product: ("halfvec_ip_ops", "<#>"),
+        }
+        return ops[self.measure()]
+
+    def _create_half_precision_index(self) -> None:
+        """
+        Create an HNSW index over float16 casts of the stored vectors.
+        The column keeps full precision, so only queries that downcast
+        their vector the same way (see _query_half_precision) use this index.
+        """
+        opclass, _ = self._half_precision_ops()
+        hnsw_arguments = self._hnsw_index_arguments()
+        with_clause = (
+            " WITH (" + ", ".join(f"{key} = {value}" for key, value in hnsw_arguments.items()) + ")"
+            if hnsw_arguments else ""
+        )
+        ddl = text(
+            f'CREATE INDEX IF NOT EXISTS "ix_{self.table_name}_vec_halfvec_hnsw" '
+            f'ON vecs."{self.table_name}" USING hnsw '
+            f'((vec::halfvec({self.embedding_dim})) {opclass}){with_clause}'
+        )
+        try:
+            with self.collection.client.Session() as session:
+                session.execute(ddl)
+                session.commit()
+        except Exception as e:
+            raise VectorStoreInitError(
+                f"Failed to create half precision index for collection {self.table_name}: {str(e)}"
+            ) from e
+
+    def _query_half_precision(self, query_embedding: List[float], top_k: int) -> List[Record]:
+        """Search through the halfvec index, downcasting the query vector to match it"""
+        _, operator = self._half_precision_ops()
+        halfvec = f"halfvec({self.embedding_dim})"
+        distance = f"(vec::{halfvec} {operator} CAST(:query AS {halfvec}))"
+        stmt = text(
+            f'SELECT id, {distance} AS distance, metadata FROM vecs."{self.table_name}" '
+            f'ORDER BY {distance} LIMIT :top_k'
+        )
+        with self.collection.client.Session() as session:
+            with session.begin():
+                if self.hnsw_params.search_ef is not None:
+                    session.execute(
+                        text("set local hnsw.ef_search = :ef_search").bindparams(ef_search=self.hnsw_params.search_ef)
+                    )
+                rows = session.execute(stmt, {
+                    "query": "[" + ",".join(map(str, query_embedding)) + "]",
+                    "top_k": top_k
+                }).fetchall()
+        return [(id, distance, metadata) for id, distance, metadata in rows]
+
     async def add_documents(
         self,
         documents: List[str],
@@ -117,12 +211,15 @@ class PostgresVectorStore(VectorStore):
         query_embedding: List[float],
         top_k: int = 5
     ) -> List[SearchResult]:
+        if self.half_precision:
+            return self._query_half_precision(query_embedding, top_k)
         return self.collection.query(
             data=query_embedding,
             limit=top_k,
             measure=self.measure(),
             include_value=True,
-            include_metadata=True
+            include_metadata=True,
+            ef_search=self.hnsw_params.search_ef
         )
 
     async def delete(self, ids: List[str]) -> None:
@@ -1,4 +1,4 @@
-from typing import Literal, List
+from typing import Literal, List, Optional
 from sqlalchemy import Column, Index, MetaData, String, Table, column, func, select
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import declarative_base, sessionmaker
@@ -11,7 +11,7 @@ from knowlang.vector_stores.factory import register_vector_store
 from knowlang.vector_stores.base import VectorStoreError, VectorStoreInitError, SearchResult
 from knowlang.vector_stores.postgres import PostgresVectorStore
 from knowlang.search.keyword_search import KeywordSearchableStore
-from knowlang.configs import DBConfig, EmbeddingConfig
+from knowlang.configs import DBConfig, EmbeddingConfig, HNSWParams
 from knowlang.utils import FancyLogger
 from knowlang.core.types import VectorStoreProvider
 from knowlang.search.base import SearchMethodology
@@ -45,6 +45,8 @@ class PostgresHybridStore(PostgresVectorStore, KeywordSearchableStore):
             embedding_dim=embedding_config.dimension,
             similarity_metric=config.similarity_metric,
             content_field=config.content_field,
+            hnsw_params=config.hnsw_params(),
+            half_precision=config.half_precision_index,
         )
 
     def __init__(
@@ -55,7 +57,9 @@ class PostgresHybridStore(PostgresVectorStore, KeywordSearchableStore):
         similarity_metric: Literal['cosine'] = 'cosine',
         text_search_config: str = "english",
         content_field: str = "content",
-        schema: str = "vecs"
+        schema: str = "vecs",
+        hnsw_params: Optional[HNSWParams] = None,
+        half_precision: bool = False
     ):
         """Initialize the hybrid store with both vector and text search capabilities.
         
@@ -67,6 +71,8 @@ class PostgresHybridStore(PostgresVectorStore, KeywordSearchableStore):
             text_search_config: PostgreSQL text search configuration
             content_field: The metadata field containing text to be searched
             schema: The PostgreSQL schema where the tables are located (default: 'vecs')
+            hnsw_params: HNSW index parameters for the vector index
+            half_precision: Index float16 casts of the embeddings instead of the full precision vectors
         """
         # Initialize vector store capabilities with content_field
         super().__init__(
@@ -74,7 +80,9 @@ class PostgresHybridStore(PostgresVectorStore, KeywordSearchableStore):
             table_name=table_name,
             embedding_dim=embedding_dim,
             similarity_metric=similarity_metric,
-            content_field=content_field
+            content_field=content_field,
+            hnsw_params=hnsw_params,
+            half_precision=half_precision
         )
         
         # Initialize text search specific attributes
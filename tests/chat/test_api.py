@@ -0,0 +1,85 @@
+import json
+from typing import AsyncGenerator, List, Tuple
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from knowlang.chat_bot import ChatStatus, StreamingChatResult
+from knowlang.chat_bot.api import (app, get_chat_analytics,
+                                   get_vector_store)
+from knowlang.search import SearchResult
+
+
+def parse_sse(body: str) -> List[Tuple[str, str]]:
+    """Split a server-sent event stream into (event, data) pairs"""
+    events = []
+    for block in body.replace("\r\n", "\n").split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in block.split("\n")
+            if line and not line.startswith(":")
+        )
+        if "event" in fields:
+            events.append((fields["event"], fields["data"]))
+    return events
+
+@pytest.fixture
+def client(mock_vector_store):
+    """Test client for the API with the vector store and analytics dependencies overridden"""
+    app.dependency_overrides[get_vector_store] = lambda: mock_vector_store
+    app.dependency_overrides[get_chat_analytics] = lambda: None
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+def test_stream_chat_sends_json_events(client: TestClient):
+    """Test that each SSE event is named after its status and carries a JSON StreamingChatResult"""
+    results = [
+        StreamingChatResult(
+            answer="",
+            status=ChatStatus.RETRIEVING,
+            progress_message="Searching codebase with: 'test query'"
+        ),
+        StreamingChatResult(
+            answer="Test answer with None and 'quotes'",
+            retrieved_context=[SearchResult(document="def test(): pass", metadata={"file_path": "test.py"}, score=0.9)],
+            status=ChatStatus.COMPLETE,
+            progress_message="Response ready"
+        ),
+    ]
+
+    async def fake_stream_chat_progress(query, vector_store, config) -> AsyncGenerator[StreamingChatResult, None]:
+        assert query == "test query"
+        for result in results:
+            yield result
+
+    with patch("knowlang.chat_bot.api.stream_chat_progress", fake_stream_chat_progress):
+        response = client.get("/api/v1/chat/stream", params={"query": "test query"})
+
+    assert response.status_code == 200
+    events = parse_sse(response.text)
+    assert [event for event, _ in events] == ["retrieving", "complete"]
+    for (_, data), expected in zip(events, results):
+        assert StreamingChatResult.model_validate(json.loads(data)) == expected
+
+def test_lifespan_warms_up_vector_store_and_reranker():
+    """Test that app startup opens the vector store and warms up the reranker"""
+    with patch("knowlang.chat_bot.api.VectorStoreFactory") as mock_factory, \
+         patch("knowlang.chat_bot.api.GraphCodeBertReranker") as mock_reranker_cls:
+        with TestClient(app):
+            pass
+
+    mock_factory.get.assert_called_once()
+    mock_reranker_cls.return_value.warm_up.assert_called_once_with()
+
+def test_lifespan_warm_up_failure_does_not_stop_startup():
+    """Test that a failing warm-up is logged and the app still serves requests"""
+    with patch("knowlang.chat_bot.api.VectorStoreFactory"), \
+         patch("knowlang.chat_bot.api.GraphCodeBertReranker") as mock_reranker_cls, \
+         patch("knowlang.chat_bot.api.LOG") as mock_log:
+        mock_reranker_cls.return_value.warm_up.side_effect = OSError("Model download failed")
+        with TestClient(app) as client:
+            response = client.get("/openapi.json")
+
+    assert response.status_code == 200
+    mock_log.warning.assert_called_once()
+    assert "Model download failed" in mock_log.warning.call_args[0][0]
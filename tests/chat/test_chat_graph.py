@@ -16,6 +16,11 @@ from knowlang.chat_bot.chat_graph import (
 from knowlang.search.search_graph.keyword_search_agent_node import KeywordSearchAgentNode
 
 
+@pytest.fixture(autouse=True)
+def reset_agent_instance():
+    AnswerQuestionNode._agent_instance = None
+
+
 @pytest.mark.asyncio
 @patch('knowlang.chat_bot.chat_graph.Agent')
 async def test_answer_question_node(mock_agent_class, mock_config, populated_mock_store):
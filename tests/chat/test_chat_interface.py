@@ -47,6 +47,8 @@ def test_format_code_block(interface):
     assert "```python" in formatted
     assert code in formatted
     assert "</details>" in formatted
+    # The block title matches the code context title
+    assert f"<summary>{CodeContext.from_metadata(metadata).to_title()}</summary>" in formatted
 
 
 def test_code_context_formatting():
@@ -153,6 +155,53 @@ async def test_stream_response_successful_flow(mock_stream_progress, interface,
     assert final_history[2].content == "Final answer"  # Final answer
 
 
+@pytest.mark.asyncio
+@patch('knowlang.chat_bot.chat_interface.stream_chat_progress')
+async def test_stream_response_updates_progress_in_place(mock_stream_progress, interface, mock_request):
+    """Test that progress ticks update a single message in place and that it is removed on completion"""
+    async def mock_stream():
+        yield StreamingChatResult(
+            answer="",
+            status=ChatStatus.STARTING,
+            progress_message="Processing question"
+        )
+        yield StreamingChatResult(
+            answer="",
+            status=ChatStatus.RETRIEVING,
+            progress_message="Searching codebase"
+        )
+        yield StreamingChatResult(
+            answer="Final answer",
+            status=ChatStatus.COMPLETE,
+            progress_message="Complete"
+        )
+    
+    mock_stream_progress.return_value = mock_stream()
+    
+    # The same history list is yielded every time, so snapshot it at each yield
+    snapshots = []
+    async for updated_history in interface.stream_response("test question", [], mock_request):
+        snapshots.append([
+            (message.content, dict(message.metadata or {})) for message in updated_history
+        ])
+    
+    _, first_tick, second_tick, final = snapshots
+    progress_messages = [
+        (i, content, metadata) for i, (content, metadata) in enumerate(second_tick)
+        if metadata.get("status") == "pending"
+    ]
+    
+    # First tick adds the progress message after the user question
+    assert len(first_tick) == 2
+    assert first_tick[1] == ("Processing question", {"title": "Starting Progress", "status": "pending"})
+    # Second tick updates that same message instead of appending another
+    assert progress_messages == [(1, "Searching codebase", {"title": "Retrieving Progress", "status": "pending"})]
+    assert len(second_tick) == 2
+    # On completion the progress message is replaced by the answer
+    assert [content for content, _ in final] == ["test question", "Final answer"]
+    assert all(metadata.get("status") != "pending" for _, metadata in final)
+
+
 @pytest.mark.asyncio
 @patch('knowlang.chat_bot.chat_interface.stream_chat_progress')
 async def test_stream_response_error_handling(mock_stream_progress, interface, mock_request):
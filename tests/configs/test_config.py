@@ -0,0 +1,86 @@
+import pytest
+from pydantic import ValidationError
+
+from knowlang.configs import (DEFAULT_HNSW_PARAMS, DBConfig, EmbeddingConfig,
+                              HNSWParams, ModelProvider)
+
+
+class TestDBConfigHNSWParams:
+    """Tests for resolving HNSW parameters from DBConfig"""
+
+    def test_unset_leaves_backend_defaults(self):
+        """Test that no size and no overrides leave every parameter to the backend"""
+        assert DBConfig().hnsw_params() == DEFAULT_HNSW_PARAMS
+        assert DEFAULT_HNSW_PARAMS == HNSWParams(m=None, construction_ef=None, search_ef=None)
+
+    @pytest.mark.parametrize("expected_size, params", [
+        (1, HNSWParams(m=16, construction_ef=64, search_ef=40)),
+        (99_999, HNSWParams(m=16, construction_ef=64, search_ef=40)),
+        (100_000, HNSWParams(m=24, construction_ef=100, search_ef=100)),
+        (999_999, HNSWParams(m=24, construction_ef=100, search_ef=100)),
+        (1_000_000, HNSWParams(m=32, construction_ef=128, search_ef=200)),
+        (50_000_000, HNSWParams(m=32, construction_ef=128, search_ef=200)),
+    ])
+    def test_size_tiers(self, expected_size: int, params: HNSWParams):
+        """Test that the expected collection size selects the matching tier"""
+        assert DBConfig(expected_collection_size=expected_size).hnsw_params() == params
+
+    def test_explicit_overrides(self):
+        """Test that explicitly set parameters take precedence over the size tier"""
+        config = DBConfig(
+            expected_collection_size=2_000_000,
+            hnsw_m=8,
+            hnsw_construction_ef=50,
+            hnsw_search_ef=20,
+        )
+        assert config.hnsw_params() == HNSWParams(m=8, construction_ef=50, search_ef=20)
+
+    def test_partial_overrides_with_size(self):
+        """Test that unset parameters are filled from the size tier"""
+        config = DBConfig(expected_collection_size=500_000, hnsw_search_ef=300)
+        assert config.hnsw_params() == HNSWParams(m=24, construction_ef=100, search_ef=300)
+
+    def test_partial_overrides_without_size(self):
+        """Test that unset parameters stay unset when no size is given"""
+        config = DBConfig(hnsw_m=48)
+        assert config.hnsw_params() == HNSWParams(m=48, construction_ef=None, search_ef=None)
+
+
+class TestEmbeddingConfigResolvedModelName:
+    """Tests for resolving the model name sent to the embedding provider"""
+
+    @pytest.mark.parametrize("model_name", ["mxbai-embed-large", "nomic-embed-text:latest"])
+    def test_quantization_without_base_tag_is_rejected(self, model_name: str):
+        """Test that untagged and latest names are rejected, as Ollama publishes no quantized tags for them"""
+        with pytest.raises(ValidationError, match="explicit base tag"):
+            EmbeddingConfig(model_name=model_name, model_provider=ModelProvider.OLLAMA, quantization="q8_0")
+
+    @pytest.mark.parametrize("model_name, quantization, expected", [
+        ("embeddinggemma:300m-qat", "q8_0", "embeddinggemma:300m-qat-q8_0"),
+        ("embeddinggemma:300m-qat", "q4_0", "embeddinggemma:300m-qat-q4_0"),
+        ("mxbai-embed-large:335m-v1", "fp16", "mxbai-embed-large:335m-v1-fp16"),
+    ])
+    def test_tagged_model_gets_quantization_suffix(self, model_name: str, quantization: str, expected: str):
+        """Test that a tagged model gets the quantization appended to its tag"""
+        config = EmbeddingConfig(model_name=model_name, model_provider=ModelProvider.OLLAMA, quantization=quantization)
+        assert config.resolved_model_name == expected
+
+    def test_no_quantization_is_unchanged(self):
+        """Test that the model name is used as is without a quantization"""
+        config = EmbeddingConfig(model_name="mxbai-embed-large", model_provider=ModelProvider.OLLAMA)
+        assert config.resolved_model_name == "mxbai-embed-large"
+
+    def test_non_ollama_provider_is_unchanged(self):
+        """Test that quantization only applies to Ollama models"""
+        config = EmbeddingConfig(model_name="BAAI/bge-small-en-v1.5", model_provider=ModelProvider.TEI, quantization="q8_0")
+        assert config.resolved_model_name == "BAAI/bge-small-en-v1.5"
+
+    def test_fp16_on_qat_model_is_rejected(self):
+        """Test that fp16 is rejected for QAT models, which are only published quantized"""
+        with pytest.raises(ValidationError):
+            EmbeddingConfig(model_name="embeddinggemma:300m-qat", model_provider=ModelProvider.OLLAMA, quantization="fp16")
+
+    def test_already_quantized_tag_is_rejected(self):
+        """Test that a quantization cannot be appended to an already quantized tag"""
+        with pytest.raises(ValidationError):
+            EmbeddingConfig(model_name="embeddinggemma:300m-qat-q8_0", model_provider=ModelProvider.OLLAMA, quantization="q4_0")
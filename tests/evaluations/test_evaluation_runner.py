@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest import mock
 from pathlib import Path
@@ -166,4 +167,134 @@ class TestCodeSearchEvaluator:
         assert run.language == "python"
         assert run.num_queries == 2
         assert run.mrr == 0.75  # Average of 1.0 and 0.5
-    
\ No newline at end of file
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrent_queries, expected_peak", [(1, 1), (3, 3)])
+    async def test_evaluate_dataset_concurrency(
+        self, 
+        code_search_evaluator: CodeSearchEvaluator, 
+        sample_search_configuration: SearchConfiguration, 
+        max_concurrent_queries: int,
+        expected_peak: int
+    ) -> None:
+        """Test that dataset queries are bounded by the evaluator concurrency setting."""
+        query_map = {
+            f"query{i}": {
+                "query": f"test query {i}",
+                "language": "python",
+                "relevant_code": [f"code{i}"]
+            }
+            for i in range(6)
+        }
+        code_search_evaluator.config.evaluator.max_concurrent_queries = max_concurrent_queries
+        
+        in_flight = 0
+        peak = 0
+        
+        async def fake_evaluate_query(query_id: str, query: str, relevant_code_ids: List[str], config: SearchConfiguration) -> QueryEvaluationResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return QueryEvaluationResult(
+                query_id=query_id,
+                query=query,
+                relevant_code_ids=relevant_code_ids,
+                results=[],
+                query_time=0.1,
+                mrr=1.0 if query_id == "query0" else 0.0,
+            )
+        
+        with mock.patch.object(code_search_evaluator.query_manager, "load_query_mappings", return_value=query_map), \
+             mock.patch.object(code_search_evaluator, "initialize"), \
+             mock.patch.object(code_search_evaluator, "evaluate_query", side_effect=fake_evaluate_query), \
+             mock.patch.object(code_search_evaluator, "save_evaluation_run"):
+            
+            run = await code_search_evaluator.evaluate_dataset(
+                dataset_name="test_dataset",
+                language="python",
+                config=sample_search_configuration
+            )
+        
+        assert peak == expected_peak
+        assert run.num_queries == 6
+        assert run.mrr == pytest.approx(1 / 6)
+        assert run.avg_query_time == pytest.approx(0.1)
+
+    @pytest.mark.asyncio
+    async def test_evaluate_dataset_aggregates_in_input_order(
+        self, 
+        code_search_evaluator: CodeSearchEvaluator, 
+        sample_search_configuration: SearchConfiguration
+    ) -> None:
+        """Test that concurrent results are aggregated in query order rather than completion order."""
+        # Float addition is not associative: in query order these times sum to 0.0, in completion order to 1.0
+        query_times = {"query0": 1.0, "query1": 1e16, "query2": -1e16}
+        query_map = {
+            query_id: {"query": f"test {query_id}", "language": "python", "relevant_code": []}
+            for query_id in query_times
+        }
+        code_search_evaluator.config.evaluator.max_concurrent_queries = 3
+        
+        async def fake_evaluate_query(query_id: str, query: str, relevant_code_ids: List[str], config: SearchConfiguration) -> QueryEvaluationResult:
+            # Later queries finish first
+            await asyncio.sleep(0.01 * (3 - int(query_id[-1])))
+            return QueryEvaluationResult(
+                query_id=query_id,
+                query=query,
+                relevant_code_ids=relevant_code_ids,
+                results=[],
+                query_time=query_times[query_id],
+            )
+        
+        with mock.patch.object(code_search_evaluator.query_manager, "load_query_mappings", return_value=query_map), \
+             mock.patch.object(code_search_evaluator, "initialize"), \
+             mock.patch.object(code_search_evaluator, "evaluate_query", side_effect=fake_evaluate_query), \
+             mock.patch.object(code_search_evaluator, "save_evaluation_run"):
+            
+            run = await code_search_evaluator.evaluate_dataset(
+                dataset_name="test_dataset",
+                language="python",
+                config=sample_search_configuration
+            )
+        
+        assert run.num_queries == 3
+        assert run.avg_query_time == 0.0
+
+    @pytest.mark.asyncio
+    async def test_evaluate_dataset_cancels_pending_queries_on_error(
+        self, 
+        code_search_evaluator: CodeSearchEvaluator, 
+        sample_search_configuration: SearchConfiguration
+    ) -> None:
+        """Test that a failing query cancels the queries still running."""
+        query_map = {
+            f"query{i}": {"query": f"test query {i}", "language": "python", "relevant_code": []}
+            for i in range(4)
+        }
+        code_search_evaluator.config.evaluator.max_concurrent_queries = 4
+        cancelled = []
+        
+        async def fake_evaluate_query(query_id: str, query: str, relevant_code_ids: List[str], config: SearchConfiguration) -> QueryEvaluationResult:
+            if query_id == "query0":
+                raise ValueError("Search failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(query_id)
+                raise
+        
+        with mock.patch.object(code_search_evaluator.query_manager, "load_query_mappings", return_value=query_map), \
+             mock.patch.object(code_search_evaluator, "initialize"), \
+             mock.patch.object(code_search_evaluator, "evaluate_query", side_effect=fake_evaluate_query), \
+             mock.patch.object(code_search_evaluator, "save_evaluation_run"):
+            
+            with pytest.raises(ValueError, match="Search failed"):
+                await code_search_evaluator.evaluate_dataset(
+                    dataset_name="test_dataset",
+                    language="python",
+                    config=sample_search_configuration
+                )
+        
+        assert sorted(cancelled) == ["query1", "query2", "query3"]
@@ -1,13 +1,15 @@
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from knowlang.configs import AppConfig
+from knowlang.configs import AppConfig, EmbeddingConfig, ModelProvider
 from knowlang.core.types import (BaseChunkType, CodeChunk, CodeLocation,
                                  LanguageEnum)
 from knowlang.indexing.chunk_indexer import ChunkIndexer
-from knowlang.indexing.indexing_agent import IndexingAgent
+from knowlang.indexing.indexing_agent import IndexingAgent, build_summary_prompt
+from knowlang.indexing.summary_cache import SummaryCache
 from knowlang.vector_stores.mock import MockVectorStore
 
 
@@ -38,9 +40,13 @@ def mock_vector_store():
 @pytest.fixture
 def mock_indexing_agent():
     with patch('knowlang.indexing.chunk_indexer.IndexingAgent') as mock_agent_cls:
-        with patch('knowlang.indexing.chunk_indexer.generate_embedding', return_value=[0.1, 0.2, 0.3]) as mock_generate_embedding:
+        with patch(
+            'knowlang.indexing.chunk_indexer.generate_embedding',
+            side_effect=lambda input, *args, **kwargs: [0.1, 0.2, 0.3] if isinstance(input, str) else [[0.1, 0.2, 0.3]] * len(input)
+        ) as mock_generate_embedding:
             mock_agent = Mock()
             mock_agent.summarize_chunk = AsyncMock(return_value="Test summary")
+            mock_agent.summarize_chunks_batch = AsyncMock(side_effect=lambda chunks: ["Test summary"] * len(chunks))
             mock_agent_cls.return_value = mock_agent
             yield mock_agent
 
@@ -107,9 +113,10 @@ async def test_process_multiple_chunks_with_summarization(chunk_indexer: ChunkIn
     # Process chunks
     chunk_ids = await chunk_indexer.process_file_chunks(Path("test.py"), chunks)
     
-    # Verify
+    # Verify all chunks were summarized in a single batched request
     assert len(chunk_ids) == 3
-    assert mock_indexing_agent.summarize_chunk.call_count == 3
+    assert mock_indexing_agent.summarize_chunks_batch.call_count == 1
+    assert mock_indexing_agent.summarize_chunk.call_count == 0
     
     # Verify all documents were added to vector store
     docs = await chunk_indexer.vector_store.get_all()
@@ -121,7 +128,8 @@ async def test_error_handling_during_summarization(chunk_indexer: ChunkIndexer,
     # Enable code summarization
     chunk_indexer.config.parser.enable_code_summarization = True
 
-    # Configure mock to raise exception
+    # Configure mock to raise exception for both batched and per-chunk summaries
+    mock_indexing_agent.summarize_chunks_batch.side_effect = Exception("Test error")
     mock_indexing_agent.summarize_chunk.side_effect = Exception("Test error")
     
     # Create test chunks
@@ -137,4 +145,174 @@ async def test_error_handling_during_summarization(chunk_indexer: ChunkIndexer,
     assert len(chunk_ids) == 0
     
     # Verify error didn't prevent trying to process all chunks
-    assert mock_indexing_agent.summarize_chunk.call_count == 2
\ No newline at end of file
+    assert mock_indexing_agent.summarize_chunk.call_count == 2
+
+@pytest.mark.asyncio
+async def test_process_file_chunks_batches_writes(chunk_indexer: ChunkIndexer):
+    """Test that chunks from a file are written in batches of add_batch_size"""
+    chunk_indexer.config.embedding.batch_size = 1
+    chunk_indexer.config.db.add_batch_size = 2
+
+    chunks = [
+        create_test_chunk("test.py", f"def test{i}(): pass", start_line=i * 10, end_line=i * 10 + 1)
+        for i in range(3)
+    ]
+
+    chunk_ids = await chunk_indexer.process_file_chunks(Path("test.py"), chunks)
+
+    assert len(chunk_ids) == 3
+    # 3 chunks with a batch size of 2 are written in 2 calls
+    assert chunk_indexer.vector_store.add_documents_mock.call_count == 2
+    docs = await chunk_indexer.vector_store.get_all()
+    assert len(docs) == 3
+
+@pytest.mark.asyncio
+async def test_identical_chunks_share_one_embedding(chunk_indexer: ChunkIndexer):
+    """Test that chunks with identical text are embedded once"""
+    chunks = [
+        create_test_chunk("test.py", "def __init__(self): pass", start_line=i * 10, end_line=i * 10 + 1)
+        for i in range(3)
+    ] + [create_test_chunk("test.py", "def other(): pass", start_line=100, end_line=101)]
+
+    with patch.object(chunk_indexer, "_get_embeddings_batch", wraps=chunk_indexer._get_embeddings_batch) as mock_embed:
+        chunk_ids = await chunk_indexer.process_file_chunks(Path("test.py"), chunks)
+
+    assert len(chunk_ids) == 4
+    mock_embed.assert_called_once_with(["def __init__(self): pass", "def other(): pass"])
+    docs = await chunk_indexer.vector_store.get_all()
+    assert len(docs) == 4
+
+@pytest.mark.asyncio
+async def test_summarization_respects_max_concurrent(chunk_indexer: ChunkIndexer, mock_indexing_agent: IndexingAgent):
+    """Test that chunk summaries run concurrently but never above the configured limit"""
+    chunk_indexer.config.parser.enable_code_summarization = True
+    chunk_indexer.config.llm.max_concurrent = 2
+    chunk_indexer.config.parser.summarization_batch_size = 1
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_summary(chunk, prompt=None):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "Test summary"
+
+    mock_indexing_agent.summarize_chunk.side_effect = slow_summary
+
+    chunks = [
+        create_test_chunk("test.py", f"def test{i}(): pass", start_line=i * 10, end_line=i * 10 + 1)
+        for i in range(5)
+    ]
+
+    chunk_ids = await chunk_indexer.process_file_chunks(Path("test.py"), chunks)
+
+    assert len(chunk_ids) == 5
+    assert max_in_flight == 2
+
+
+def test_pack_summary_batches_respects_token_budget(chunk_indexer: ChunkIndexer):
+    """Test that an oversized chunk is summarized alone while small chunks share a batch"""
+    chunk_indexer.config.parser.enable_code_summarization = True
+    chunk_indexer.config.parser.summarization_batch_size = 8
+    chunk_indexer.config.parser.summarization_max_batch_tokens = 200
+
+    small_chunks = [
+        create_test_chunk("test.py", f"def test{i}(): pass", start_line=i * 10, end_line=i * 10 + 1)
+        for i in range(3)
+    ]
+    large_chunk = create_test_chunk("test.py", "x = 1\n" * 500, start_line=100, end_line=600)
+
+    chunks = [large_chunk] + small_chunks
+    batches = chunk_indexer._pack_summary_batches(chunks, chunk_indexer._build_summary_prompts(chunks))
+
+    assert batches == [small_chunks, [large_chunk]]
+
+@pytest.mark.asyncio
+async def test_batch_summarization_falls_back_to_single_chunks(chunk_indexer: ChunkIndexer, mock_indexing_agent: IndexingAgent):
+    """Test that a failed batch request is retried one chunk at a time"""
+    chunk_indexer.config.parser.enable_code_summarization = True
+    mock_indexing_agent.summarize_chunks_batch.side_effect = ValueError("Malformed batch response")
+
+    chunks = [
+        create_test_chunk("test.py", "def test1(): pass", start_line=1, end_line=2),
+        create_test_chunk("test.py", "def test2(): pass", start_line=10, end_line=20),
+    ]
+
+    chunk_ids = await chunk_indexer.process_file_chunks(Path("test.py"), chunks)
+
+    assert len(chunk_ids) == 2
+    assert mock_indexing_agent.summarize_chunk.call_count == 2
+
+@pytest.mark.asyncio
+async def test_summary_prompts_are_built_once(chunk_indexer: ChunkIndexer, mock_indexing_agent: IndexingAgent):
+    """Test that each prompt is built once and reused for token counting and the single-chunk request"""
+    chunk_indexer.config.parser.enable_code_summarization = True
+    mock_indexing_agent.summarize_chunks_batch.side_effect = ValueError("Malformed batch response")
+
+    chunks = [
+        create_test_chunk("test.py", "def test1(): pass", start_line=1, end_line=2),
+        create_test_chunk("test.py", "def test2(): pass", start_line=10, end_line=20),
+    ]
+
+    with patch('knowlang.indexing.chunk_indexer.build_summary_prompt', side_effect=build_summary_prompt) as mock_build:
+        await chunk_indexer.process_file_chunks(Path("test.py"), chunks)
+
+    assert mock_build.call_count == len(chunks)
+    sent_prompts = [call.kwargs["prompt"] for call in mock_indexing_agent.summarize_chunk.call_args_list]
+    assert sent_prompts == [build_summary_prompt(chunk) for chunk in chunks]
+
+@pytest.mark.asyncio
+async def test_summary_cache_skips_unchanged_chunks(chunk_indexer: ChunkIndexer, mock_indexing_agent: IndexingAgent, tmp_path: Path):
+    """Test that re-indexing unchanged chunks reuses cached summaries and embeddings"""
+    chunk_indexer.config.parser.enable_code_summarization = True
+    chunk_indexer.config.db.persist_directory = tmp_path
+    chunk_indexer.summary_cache = SummaryCache(chunk_indexer.config)
+
+    chunks = [
+        create_test_chunk("test.py", "def test1(): pass", start_line=1, end_line=2),
+        create_test_chunk("test.py", "def test2(): pass", start_line=10, end_line=20),
+    ]
+
+    first_ids = await chunk_indexer.process_file_chunks(Path("test.py"), chunks)
+    chunk_indexer.vector_store.reset()
+    second_ids = await chunk_indexer.process_file_chunks(Path("test.py"), chunks)
+
+    assert first_ids == second_ids
+    # Only the first run needed the LLM
+    assert mock_indexing_agent.summarize_chunks_batch.call_count == 1
+    docs = await chunk_indexer.vector_store.get_all()
+    assert [doc.document for doc in docs] == ["Test summary", "Test summary"]
+
+@pytest.mark.parametrize("constant", ["SUMMARY_CACHE_VERSION", "SUMMARY_PROMPT_FINGERPRINT"])
+def test_summary_cache_key_tracks_version_and_prompts(mock_config: AppConfig, tmp_path: Path, constant: str):
+    """Test that bumping the cache version or changing a prompt invalidates cached summaries"""
+    mock_config.parser.enable_code_summarization = True
+    mock_config.db.persist_directory = tmp_path
+    cache = SummaryCache(mock_config)
+    chunk = create_test_chunk("test.py", "def test(): pass")
+
+    original_key = cache.compute_key(chunk)
+    with patch(f"knowlang.indexing.summary_cache.{constant}", "changed"):
+        assert cache.compute_key(chunk) != original_key
+
+@pytest.mark.parametrize("field, value", [
+    ("model_name", "BAAI/bge-large-en-v1.5"),
+    ("tei_url", "http://other-tei:8080"),
+])
+def test_summary_cache_key_tracks_embedder(mock_config: AppConfig, tmp_path: Path, field: str, value: str):
+    """Test that changing the embedding model or TEI server invalidates cached embeddings"""
+    mock_config.db.persist_directory = tmp_path
+    mock_config.embedding = EmbeddingConfig(
+        model_provider=ModelProvider.TEI,
+        model_name="BAAI/bge-small-en-v1.5",
+        tei_url="http://tei:8080"
+    )
+    cache = SummaryCache(mock_config)
+    chunk = create_test_chunk("test.py", "def test(): pass")
+
+    original_key = cache.compute_key(chunk)
+    setattr(mock_config.embedding, field, value)
+    assert cache.compute_key(chunk) != original_key
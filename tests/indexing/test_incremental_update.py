@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -231,4 +232,36 @@ async def test_update_codebase_exception(updater: IncrementalUpdater):
     # Verify
     assert stats.errors == 1
     assert stats.files_added == 0
-    assert stats.chunks_added == 0
\ No newline at end of file
+    assert stats.chunks_added == 0
+
+@pytest.mark.asyncio
+async def test_process_changes_runs_files_concurrently(updater: IncrementalUpdater, mock_chunk_indexer: ChunkIndexer, mock_state_manager: StateManager):
+    """Test that files are indexed concurrently, sharing one LLM semaphore and saving state per file"""
+    updater.app_config.llm.max_concurrent = 2
+    file_names = [f"test{i}.py" for i in range(5)]
+    chunks = [create_test_chunk(name, "def test(): pass") for name in file_names]
+    changes = [FileChange(path=Path(name), change_type=StateChangeType.ADDED) for name in file_names]
+    
+    in_flight = 0
+    peak = 0
+    semaphores = set()
+    
+    async def fake_process_file_chunks(file_path, file_chunks, semaphore=None):
+        nonlocal in_flight, peak
+        semaphores.add(id(semaphore))
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {f"{file_path}:chunk"}
+    
+    mock_chunk_indexer.process_file_chunks.side_effect = fake_process_file_chunks
+    
+    stats = await updater.process_changes(changes, chunks)
+    
+    assert stats.files_added == 5
+    assert stats.chunks_added == 5
+    assert stats.errors == 0
+    assert peak == 2
+    assert len(semaphores) == 1
+    assert mock_state_manager.update_file_state.call_count == 5
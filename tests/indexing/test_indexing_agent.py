@@ -7,7 +7,10 @@ import pytest
 from knowlang.configs import AppConfig
 from knowlang.core.types import (BaseChunkType, CodeChunk, CodeLocation,
                                  LanguageEnum)
-from knowlang.indexing.indexing_agent import IndexingAgent
+from knowlang.indexing.indexing_agent import (ChunkSummary, IndexingAgent,
+                                              SummaryOutput,
+                                              build_batch_summary_prompt,
+                                              build_summary_prompt)
 from knowlang.utils import format_code_summary
 from knowlang.vector_stores import VectorStoreError
 from knowlang.vector_stores.mock import MockVectorStore
@@ -61,7 +64,10 @@ def mock_vector_store():
 @pytest.fixture
 def mock_summary():
     """Create a sample summary result"""
-    return "This is a test function"
+    return SummaryOutput(
+        summary="This is a test function",
+        key_points=["Returns a constant string"],
+    )
 
 @pytest.fixture
 def mock_run_result(mock_summary):
@@ -97,9 +103,67 @@ async def test_summarize_chunk(
     
     # Verify result
     assert isinstance(result, str)
-    assert result == format_code_summary(sample_chunks[0].content, mock_run_result.data)
+    assert result == format_code_summary(sample_chunks[0].content, mock_run_result.data.to_text())
+    assert "This is a test function\nKey points:\n- Returns a constant string" in result
     
     # Verify agent was called with correct prompt
     call_args = mock_agent.run.call_args[0][0]
     assert "def hello()" in call_args
     assert "Says hello" in call_args
+
+    # A prompt built ahead of time is sent as is
+    await indexing_agent.summarize_chunk(sample_chunks[0], prompt="prebuilt prompt")
+    assert mock_agent.run.call_args[0][0] == "prebuilt prompt"
+
+
+def test_build_summary_prompts(sample_chunks: list[CodeChunk]):
+    """Test building single and batched summary prompts"""
+    prompt = build_summary_prompt(sample_chunks[0])
+    assert "function code chunk" in prompt
+    assert "def hello()" in prompt
+    assert "Docstring: Says hello" in prompt
+
+    batch_prompt = build_batch_summary_prompt(sample_chunks)
+    assert "following 2 code chunks" in batch_prompt
+    assert "Chunk 0 (function):\ndef hello()" in batch_prompt
+    assert "Chunk 1 (class):" in batch_prompt
+
+@pytest.mark.asyncio
+async def test_summarize_chunks_batch(
+    sample_chunks: list[CodeChunk],
+    indexing_agent: IndexingAgent
+):
+    """Test summarizing several chunks with a single agent run"""
+    mock_result = Mock()
+    # Summaries may come back out of order
+    mock_result.data = [
+        ChunkSummary(index=1, summary="A test class"),
+        ChunkSummary(index=0, summary="Says hello"),
+    ]
+    indexing_agent.batch_agent = Mock()
+    indexing_agent.batch_agent.run = AsyncMock(return_value=mock_result)
+
+    results = await indexing_agent.summarize_chunks_batch(sample_chunks)
+
+    assert results == [
+        format_code_summary(sample_chunks[0].content, "Says hello"),
+        format_code_summary(sample_chunks[1].content, "A test class"),
+    ]
+    assert indexing_agent.batch_agent.run.call_count == 1
+    prompt = indexing_agent.batch_agent.run.call_args[0][0]
+    assert "def hello()" in prompt
+    assert "class TestClass" in prompt
+
+@pytest.mark.asyncio
+async def test_summarize_chunks_batch_missing_summary(
+    sample_chunks: list[CodeChunk],
+    indexing_agent: IndexingAgent
+):
+    """Test that an incomplete batch response is rejected"""
+    mock_result = Mock()
+    mock_result.data = [ChunkSummary(index=0, summary="Says hello")]
+    indexing_agent.batch_agent = Mock()
+    indexing_agent.batch_agent.run = AsyncMock(return_value=mock_result)
+
+    with pytest.raises(ValueError):
+        await indexing_agent.summarize_chunks_batch(sample_chunks)
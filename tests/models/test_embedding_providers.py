@@ -0,0 +1,81 @@
+import inspect
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from knowlang.configs import EmbeddingConfig, ModelProvider
+from knowlang.models import EmbeddingInputType, generate_embedding
+from knowlang.models.embedding_providers import (EMBEDDING_PROVIDER_REGISTRY,
+                                                 _get_tei_client)
+
+
+def make_response(embeddings: List[List[float]]) -> MagicMock:
+    """Helper to create a successful TEI /embed response"""
+    response = MagicMock()
+    response.json.return_value = embeddings
+    return response
+
+@pytest.fixture
+def tei_config() -> EmbeddingConfig:
+    return EmbeddingConfig(
+        model_provider=ModelProvider.TEI,
+        model_name="BAAI/bge-small-en-v1.5",
+        tei_url="http://tei:8080",
+        tei_max_client_batch_size=2
+    )
+
+@pytest.fixture
+def mock_http_client():
+    """Patch httpx.Client, clearing the cached TEI client around each test"""
+    _get_tei_client.cache_clear()
+    with patch("httpx.Client") as mock_client_cls:
+        client = mock_client_cls.return_value
+        yield mock_client_cls, client
+    _get_tei_client.cache_clear()
+
+def test_tei_splits_requests_at_max_client_batch_size(tei_config: EmbeddingConfig, mock_http_client):
+    """Test that inputs are sent in requests of at most tei_max_client_batch_size"""
+    mock_client_cls, client = mock_http_client
+    client.post.side_effect = [
+        make_response([[0.0], [1.0]]),
+        make_response([[2.0], [3.0]]),
+        make_response([[4.0]]),
+    ]
+
+    embeddings = generate_embedding(["a", "b", "c", "d", "e"], tei_config)
+
+    mock_client_cls.assert_called_once_with(base_url="http://tei:8080", timeout=60.0)
+    sent_inputs = [call.kwargs["json"]["inputs"] for call in client.post.call_args_list]
+    assert sent_inputs == [["a", "b"], ["c", "d"], ["e"]]
+    assert all(call.args == ("/embed",) for call in client.post.call_args_list)
+    # Results are joined in input order
+    assert embeddings == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+
+def test_tei_single_input_returns_one_vector(tei_config: EmbeddingConfig, mock_http_client):
+    """Test that a single string input returns a single embedding vector"""
+    _, client = mock_http_client
+    client.post.return_value = make_response([[0.5, 0.5]])
+
+    assert generate_embedding("a", tei_config) == [0.5, 0.5]
+
+def test_tei_http_error_raises_runtime_error(tei_config: EmbeddingConfig, mock_http_client):
+    """Test that a failed TEI request surfaces as a RuntimeError"""
+    _, client = mock_http_client
+    response = make_response([])
+    response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "413 Payload Too Large",
+        request=httpx.Request("POST", "http://tei:8080/embed"),
+        response=httpx.Response(413)
+    )
+    client.post.return_value = response
+
+    with pytest.raises(RuntimeError, match="413 Payload Too Large"):
+        generate_embedding(["a", "b"], tei_config)
+
+@pytest.mark.parametrize("provider", list(EMBEDDING_PROVIDER_REGISTRY))
+def test_providers_accept_config_argument(provider: ModelProvider):
+    """Test that every provider accepts the config that generate_embedding passes as its 4th argument"""
+    signature = inspect.signature(EMBEDDING_PROVIDER_REGISTRY[provider])
+    signature.bind(["a"], "model", EmbeddingInputType.DOCUMENT, EmbeddingConfig())
@@ -0,0 +1,55 @@
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+import torch
+
+from knowlang.models.graph_code_bert import calculate_relevance_scores
+
+
+class FakeTokenizer:
+    """Tokenizer that passes each batch of snippets through so the fake model can score them"""
+
+    def __init__(self):
+        self.batches: List[List[str]] = []
+
+    def __call__(self, queries: List[str], snippets: List[str], **kwargs):
+        assert len(queries) == len(snippets)
+        assert kwargs["padding"] is True
+        self.batches.append(list(snippets))
+        encoding = MagicMock()
+        encoding.to.return_value = {"snippets": snippets}
+        return encoding
+
+def fake_model(snippets: List[str]) -> MagicMock:
+    """Cross-encoder returning one logit per pair, equal to the snippet's number"""
+    outputs = MagicMock()
+    outputs.logits = torch.tensor([[float(snippet)] for snippet in snippets])
+    return outputs
+
+@pytest.fixture
+def fake_tokenizer():
+    tokenizer = FakeTokenizer()
+    with patch(
+        "knowlang.models.graph_code_bert.load_cross_encoder",
+        return_value=(fake_model, tokenizer, "cpu")
+    ):
+        yield tokenizer
+
+def test_scores_more_snippets_than_batch_size(fake_tokenizer: FakeTokenizer):
+    """Test that snippets beyond one batch get one score each, in input order"""
+    snippets = [str(i) for i in range(17)]
+
+    scores = calculate_relevance_scores("query", snippets, batch_size=16)
+
+    assert scores == [float(i) for i in range(17)]
+    assert [len(batch) for batch in fake_tokenizer.batches] == [16, 1]
+
+def test_scores_single_snippet(fake_tokenizer: FakeTokenizer):
+    """Test that a batch of one still returns a list with one score"""
+    assert calculate_relevance_scores("query", ["3"]) == [3.0]
+
+def test_scores_empty_input(fake_tokenizer: FakeTokenizer):
+    """Test that no snippets return no scores without calling the model"""
+    assert calculate_relevance_scores("query", []) == []
+    assert fake_tokenizer.batches == []
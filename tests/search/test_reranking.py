@@ -136,4 +136,19 @@ def test_reranker_result_ordering(mock_calculate_scores, reranker_config, sample
     # Verify results are ordered by descending score
     assert reranked_results[0].score == 0.95
     assert reranked_results[1].score == 0.85
-    assert reranked_results[2].score == 0.75
\ No newline at end of file
+    assert reranked_results[2].score == 0.75
+
+
+@patch("knowlang.models.graph_code_bert.load_cross_encoder")
+def test_warm_up_loads_cross_encoder(mock_load_cross_encoder, reranker_config):
+    """Test that warming up an enabled reranker loads the cross-encoder."""
+    GraphCodeBertReranker(reranker_config).warm_up()
+    mock_load_cross_encoder.assert_called_once_with()
+
+
+@patch("knowlang.models.graph_code_bert.load_cross_encoder")
+def test_warm_up_disabled(mock_load_cross_encoder, reranker_config):
+    """Test that warming up a disabled reranker is a no-op."""
+    reranker_config.enabled = False
+    GraphCodeBertReranker(reranker_config).warm_up()
+    mock_load_cross_encoder.assert_not_called()
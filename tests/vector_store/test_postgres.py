@@ -3,7 +3,7 @@ import unittest.mock as mock
 from typing import List, Dict, Any
 
 from knowlang.search import SearchResult
-from knowlang.configs import DBConfig, EmbeddingConfig
+from knowlang.configs import DBConfig, EmbeddingConfig, HNSWParams
 from knowlang.vector_stores.base import VectorStore, VectorStoreError, VectorStoreInitError
 from knowlang.vector_stores.postgres import PostgresVectorStore
 
@@ -19,6 +19,7 @@ class TestPostgresVectorStore:
         self.db_config.collection_name = "test_collection"
         self.db_config.similarity_metric = "cosine"
         self.db_config.content_field = "content"  # Add content_field to config
+        self.db_config.half_precision_index = False
         
         self.embedding_config = mock.MagicMock(spec=EmbeddingConfig)
         self.embedding_config.dimension = 128
@@ -160,4 +161,103 @@ class TestPostgresVectorStore:
         # Verify original metadata is preserved but no content field added
         for i, (id, emb, meta) in enumerate(records):
             assert "content" not in meta
-            assert meta["field"] == f"value{i+1}"
\ No newline at end of file
+            assert meta["field"] == f"value{i+1}"
+
+    def test_initialize_half_precision_index(self):
+        """Test that half precision mode builds an HNSW index over halfvec casts"""
+        store = PostgresVectorStore(
+            connection_string=self.db_config.connection_url,
+            table_name=self.db_config.collection_name,
+            embedding_dim=self.embedding_config.dimension,
+            half_precision=True
+        )
+        store.initialize()
+        
+        # The full precision vecs index is not created
+        self.mock_collection.create_index.assert_not_called()
+        
+        session = self.mock_collection.client.Session.return_value.__enter__.return_value
+        ddl = str(session.execute.call_args[0][0])
+        assert "USING hnsw" in ddl
+        assert "(vec::halfvec(128)) halfvec_cosine_ops" in ddl
+    
+    @pytest.mark.asyncio
+    async def test_query_half_precision(self):
+        """Test that half precision queries downcast the query vector"""
+        store = PostgresVectorStore(
+            connection_string=self.db_config.connection_url,
+            table_name=self.db_config.collection_name,
+            embedding_dim=self.embedding_config.dimension,
+            half_precision=True
+        )
+        store.collection = self.mock_collection
+        
+        session = self.mock_collection.client.Session.return_value.__enter__.return_value
+        session.execute.return_value.fetchall.return_value = [("id1", 0.1, {"content": "doc"})]
+        
+        results = await store.query([0.5] * 128, top_k=3)
+        
+        assert results == [("id1", 0.1, {"content": "doc"})]
+        self.mock_collection.query.assert_not_called()
+        
+        stmt, params = session.execute.call_args[0]
+        assert "vec::halfvec(128) <=> CAST(:query AS halfvec(128))" in str(stmt)
+        assert params["top_k"] == 3
+
+    def test_initialize_default_index_uses_auto_method(self):
+        """Test that without HNSW parameters vecs picks the index type"""
+        self.mock_collection.index = None
+        store = PostgresVectorStore(
+            connection_string=self.db_config.connection_url,
+            table_name=self.db_config.collection_name,
+            embedding_dim=self.embedding_config.dimension,
+        )
+        store.initialize()
+        
+        _, kwargs = self.mock_collection.create_index.call_args
+        assert kwargs["method"] == self.mock_vecs.IndexMethod.auto
+        assert kwargs["index_arguments"] is None
+    
+    def test_initialize_hnsw_index_with_parameters(self):
+        """Test that explicit HNSW parameters build an HNSW index when supported"""
+        self.mock_collection.index = None
+        self.mock_collection.client._supports_hnsw.return_value = True
+        store = PostgresVectorStore(
+            connection_string=self.db_config.connection_url,
+            table_name=self.db_config.collection_name,
+            embedding_dim=self.embedding_config.dimension,
+            hnsw_params=HNSWParams(m=24, construction_ef=100, search_ef=100)
+        )
+        store.initialize()
+        
+        _, kwargs = self.mock_collection.create_index.call_args
+        assert kwargs["method"] == self.mock_vecs.IndexMethod.hnsw
+        self.mock_vecs.IndexArgsHNSW.assert_called_once_with(m=24, ef_construction=100)
+    
+    def test_initialize_hnsw_parameters_without_hnsw_support(self):
+        """Test that HNSW parameters fall back to the auto index on pgvector < 0.5"""
+        self.mock_collection.index = None
+        self.mock_collection.client._supports_hnsw.return_value = False
+        store = PostgresVectorStore(
+            connection_string=self.db_config.connection_url,
+            table_name=self.db_config.collection_name,
+            embedding_dim=self.embedding_config.dimension,
+            hnsw_params=HNSWParams(m=24)
+        )
+        store.initialize()
+        
+        _, kwargs = self.mock_collection.create_index.call_args
+        assert kwargs["method"] == self.mock_vecs.IndexMethod.auto
+        assert kwargs["index_arguments"] is None
+    
+    def test_initialize_existing_index(self):
+        """Test that an existing index is kept"""
+        self.mock_collection.index = "ix_vector_cosine_ops_hnsw"
+        store = PostgresVectorStore(
+            connection_string=self.db_config.connection_url,
+            table_name=self.db_config.collection_name,
+            embedding_dim=self.embedding_config.dimension,
+        )
+        store.initialize()
+        
+        self.mock_collection.create_index.assert_not_called()
@@ -24,6 +24,7 @@ class TestPostgresHybridStore:
         self.db_config.similarity_metric = "cosine"
         self.db_config.content_field = "content"
         self.db_config.schema = "vecs"  # Specify schema here
+        self.db_config.half_precision_index = False
         
         self.embedding_config = mock.MagicMock(spec=EmbeddingConfig)
         self.embedding_config.dimension = 128